@@ -38,18 +38,25 @@ from .core import (
     collect,
     difference,
     distinct,
+    idifference,
+    idistinct,
+    iintersection,
+    ijoin,
     intersection,
+    iproduct,
+    iunion,
     join,
     product,
     project,
     rename,
     select,
+    select_compiled,
     sort_by,
     union,
 )
 # Import from the new modules
 from .agg import aggregate_single_group, aggregate_grouped_data
-from .group import groupby_agg, groupby_with_metadata, groupby_chained
+from .group import groupby_agg, igroupby_agg, groupby_with_metadata, groupby_chained
 # Import composable operations
 from .compose import (
     Pipeline,
@@ -89,6 +96,7 @@ __all__ = [
     "Relation",
     # Core operations
     "select",
+    "select_compiled",
     "project",
     "join",
     "rename",
@@ -99,8 +107,16 @@ __all__ = [
     "sort_by",
     "product",
     "collect",
+    # Streaming variants
+    "ijoin",
+    "iproduct",
+    "iunion",
+    "iintersection",
+    "idifference",
+    "idistinct",
     # Grouping and aggregation
     "groupby_agg",
+    "igroupby_agg",
     "groupby_with_metadata",
     "groupby_chained",
     "aggregate_single_group",
@@ -5,7 +5,9 @@ specifications, applying aggregations to data, and all built-in aggregation
 functions (sum, avg, min, max, etc.).
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from collections import Counter
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from .expr import ExprEval
 
@@ -31,6 +33,12 @@ def _agg_numeric_values(values: List[Any], strict: bool = True) -> List[float]:
     Raises:
         ValueError: If strict=True and a value cannot be converted to float
     """
+    # Usually every value converts; then one C-level pass does the work
+    try:
+        return list(map(float, values))
+    except (ValueError, TypeError):
+        pass
+
     numeric_values = []
     for v in values:
         if v is None:
@@ -44,31 +52,75 @@ def _agg_numeric_values(values: List[Any], strict: bool = True) -> List[float]:
     return numeric_values
 
 
-def _agg_sum_func(values: List[Any]) -> float:
-    """Sum of numeric values."""
-    return sum(_agg_numeric_values(values))
+def _agg_addends(values: List[Any]) -> List[Any]:
+    """Values to add up for sum and avg, skipping None.
+
+    Integers are kept as they are, so integral columns sum exactly; other
+    values are converted to float.
+
+    Raises:
+        ValueError: If a value cannot be converted to float
+    """
+    addends = []
+    for v in values:
+        if v is None:
+            continue
+        if isinstance(v, int):
+            addends.append(v)
+            continue
+        try:
+            addends.append(float(v))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Cannot convert value to number: {v!r}") from e
+    return addends
+
+
+def _agg_sum_func(values: List[Any]) -> Union[int, float]:
+    """Sum of numeric values; an int when every value is an int."""
+    # Plain numbers add up directly in one C-level pass; None, strings and
+    # other values take the conversion path
+    try:
+        return sum(values)
+    except TypeError:
+        return sum(_agg_addends(values))
 
 
 def _agg_avg_func(values: List[Any]) -> Optional[float]:
     """Average of numeric values."""
-    nums = _agg_numeric_values(values)
-    return sum(nums) / len(nums) if nums else None
+    try:
+        return sum(values) / len(values) if values else None
+    except TypeError:
+        nums = _agg_addends(values)
+        return sum(nums) / len(nums) if nums else None
 
 
 def _agg_min_func(values: List[Any]) -> Optional[float]:
     """Minimum of numeric values."""
-    nums = _agg_numeric_values(values)
-    return min(nums) if nums else None
+    try:
+        return min(map(float, values)) if values else None
+    except (ValueError, TypeError):
+        nums = _agg_numeric_values(values)
+        return min(nums) if nums else None
 
 
 def _agg_max_func(values: List[Any]) -> Optional[float]:
     """Maximum of numeric values."""
-    nums = _agg_numeric_values(values)
-    return max(nums) if nums else None
+    try:
+        return max(map(float, values)) if values else None
+    except (ValueError, TypeError):
+        nums = _agg_numeric_values(values)
+        return max(nums) if nums else None
 
 
 def _agg_list_func(values: List[Any]) -> List[Any]:
-    """Return all values as a list."""
+    """Return all values as a list.
+
+    Values are those of :func:`_agg_value_func`: integers stay ints, other
+    numbers and numeric strings become floats, and anything else is kept
+    as is. The list is returned as is, not copied: callers collect the
+    values for this aggregation's result and keep no other reference that
+    is exposed.
+    """
     return values
 
 
@@ -94,6 +146,13 @@ AGGREGATION_FUNCTIONS = {
 }
 
 
+# Aggregations computed from the collected values of their field expression
+_SHARED_VALUE_FUNCS = frozenset(["sum", "avg", "min", "max", "list"])
+
+# Rows read at a time by aggregate_by_key from inputs that are not lists
+_CHUNK_ROWS = 10000
+
+
 # ============================================================================
 # AGGREGATION OPERATIONS
 # ============================================================================
@@ -120,6 +179,91 @@ def parse_agg_specs(agg_spec: str) -> List[Tuple[str, str]]:
     return specs
 
 
+def _parse_agg_expr(expr: str) -> Tuple[str, str]:
+    """Split an aggregation expression like ``sum(amount)`` into its parts.
+
+    Args:
+        expr: Aggregation expression
+
+    Returns:
+        (function name, field expression) tuple; the field is empty for
+        bare functions such as ``count``
+    """
+    if "(" in expr and expr.endswith(")"):
+        return expr[:expr.index("(")], expr[expr.index("(") + 1:-1].strip()
+    return expr, ""
+
+
+def _agg_value_func(field_expr: str, parser: ExprEval) -> Callable[[Row], Any]:
+    """Compile the per-row value of a field expression, for aggregation.
+
+    Arithmetic results and numeric values are floats, except that integer
+    field values are kept as ints so integral sums stay exact. This also
+    holds for ``list``: an int column gives ``[1, 2]``, not ``[1.0, 2.0]``.
+    Values that are not numbers are returned as they are.
+
+    Args:
+        field_expr: Field path or arithmetic expression (empty for whole rows)
+        parser: Expression evaluator to use
+
+    Returns:
+        Function from a row to its value, or None if missing
+    """
+    if not field_expr:
+        return lambda row: row
+    get_value = parser.compile_path(field_expr)
+
+    if any(op in field_expr for op in "*+-/"):
+        arithmetic = parser.compile_arithmetic(field_expr)
+
+        def value(row: Row) -> Any:
+            val = arithmetic(row)
+            if val is None:
+                val = get_value(row)
+            return val
+
+        return value
+
+    # Plain field path: evaluate_arithmetic would convert the value to
+    # float, falling back to the key parsed as a literal when it is missing
+    literal = parser.parse_value(field_expr)
+    if type(literal) is int:
+        missing = literal
+    else:
+        try:
+            missing = float(literal)
+        except (TypeError, ValueError):
+            missing = None
+
+    def field_value(row: Row) -> Any:
+        val = get_value(row)
+        if val is None:
+            return missing
+        if type(val) is int or type(val) is float:
+            return val
+        try:
+            return float(val)
+        except (TypeError, ValueError):
+            return val
+
+    return field_value
+
+
+def _collect_agg_values(field_expr: str, data: Relation, parser: ExprEval) -> List[Any]:
+    """Collect the non-null values of a field expression across rows.
+
+    Args:
+        field_expr: Field path or arithmetic expression (empty for whole rows)
+        data: List of dictionaries
+        parser: Expression evaluator to use
+
+    Returns:
+        List of values, in row order
+    """
+    value_of = _agg_value_func(field_expr, parser)
+    return [val for val in map(value_of, data) if val is not None]
+
+
 def apply_single_agg(spec: Tuple[str, str], data: Relation) -> Dict[str, Any]:
     """Apply a single aggregation to data.
 
@@ -134,12 +278,7 @@ def apply_single_agg(spec: Tuple[str, str], data: Relation) -> Dict[str, Any]:
     parser = ExprEval()
 
     # Parse the aggregation expression
-    if "(" in expr and expr.endswith(")"):
-        func_name = expr[:expr.index("(")]
-        field_expr = expr[expr.index("(") + 1:-1].strip()
-    else:
-        func_name = expr
-        field_expr = ""
+    func_name, field_expr = _parse_agg_expr(expr)
 
     # Handle conditional aggregations
     if "_if" in func_name:
@@ -184,19 +323,8 @@ def apply_single_agg(spec: Tuple[str, str], data: Relation) -> Dict[str, Any]:
             return {name: value}
         else:
             # Collect values for aggregation
-            values = []
-            for row in data:
-                val: Any
-                if field_expr:
-                    # Try arithmetic evaluation first
-                    val = parser.evaluate_arithmetic(field_expr, row)
-                    if val is None:
-                        val = parser.get_field_value(row, field_expr)
-                else:
-                    val = row
-                if val is not None:
-                    values.append(val)
-            
+            values = _collect_agg_values(field_expr, data, parser)
+
             # Apply aggregation function
             result = AGGREGATION_FUNCTIONS[func_name](values)
             return {name: result}
@@ -207,6 +335,402 @@ def apply_single_agg(spec: Tuple[str, str], data: Relation) -> Dict[str, Any]:
                     f"Supported functions: {', '.join(sorted(known_funcs))}")
 
 
+def apply_aggs(specs: List[Tuple[str, str]], data: Relation) -> Dict[str, Any]:
+    """Apply several aggregations to the same rows.
+
+    Aggregations over the same field expression (e.g. ``sum(amount)`` and
+    ``avg(amount)``) share a single pass that collects the field's values,
+    instead of re-evaluating the expression for every row once per
+    aggregation.
+
+    Args:
+        specs: List of (name, expression) tuples
+        data: List of dictionaries
+
+    Returns:
+        Dictionary with one entry per aggregation
+    """
+    parser = ExprEval()
+    return _apply_agg_plan(_plan_aggs(specs, parser), data, parser)
+
+
+# (name, expression, function name, field expression, value function); the
+# value function is only compiled for sum/avg/min/max/list
+_AggPlan = List[Tuple[str, str, str, str, Optional[Callable[[Row], Any]]]]
+
+
+def _plan_aggs(specs: List[Tuple[str, str]], parser: ExprEval) -> _AggPlan:
+    """Resolve aggregation specs once, before any rows are aggregated.
+
+    Args:
+        specs: List of (name, expression) tuples
+        parser: Expression evaluator the value functions use
+
+    Returns:
+        One plan entry per spec, see :func:`_apply_agg_plan`
+    """
+    plan: _AggPlan = []
+    value_funcs: Dict[str, Callable[[Row], Any]] = {}
+    for name, expr in specs:
+        func_name, field_expr = _parse_agg_expr(expr)
+        value_of = None
+        if func_name in _SHARED_VALUE_FUNCS:
+            value_of = value_funcs.get(field_expr)
+            if value_of is None:
+                value_of = value_funcs[field_expr] = _agg_value_func(field_expr, parser)
+        plan.append((name, expr, func_name, field_expr, value_of))
+    return plan
+
+
+def _apply_agg_plan(
+    plan: _AggPlan, data: Relation, parser: ExprEval
+) -> Dict[str, Any]:
+    """Apply planned aggregations to rows, as :func:`apply_aggs` does.
+
+    Args:
+        plan: Entries from :func:`_plan_aggs`
+        data: List of dictionaries
+        parser: Expression evaluator to use
+
+    Returns:
+        Dictionary with one entry per aggregation
+    """
+    columns: Dict[str, List[Any]] = {}
+    # Fields whose collected values a list() result already is
+    listed = set()
+    result: Dict[str, Any] = {}
+
+    for name, expr, func_name, field_expr, value_of in plan:
+        if value_of is not None:
+            values = columns.get(field_expr)
+            if values is None:
+                values = columns[field_expr] = [
+                    v for v in map(value_of, data) if v is not None
+                ]
+            if func_name == "list":
+                # Each list() result gets a list of its own
+                if field_expr in listed:
+                    values = values.copy()
+                listed.add(field_expr)
+            result[name] = AGGREGATION_FUNCTIONS[func_name](values)
+        elif func_name == "count":
+            result[name] = len(data)
+        elif func_name in ("first", "last"):
+            if not data:
+                result[name] = None
+            else:
+                row = data[0] if func_name == "first" else data[-1]
+                if field_expr:
+                    result[name] = parser.get_field_value(row, field_expr)
+                else:
+                    result[name] = row
+        else:
+            result.update(apply_single_agg((name, expr), data))
+
+    return result
+
+
+def _split_conditional(
+    func_name: str, field_expr: str
+) -> Optional[Tuple[str, str, str]]:
+    """Parts of a conditional aggregation, as :func:`apply_single_agg` reads them.
+
+    Args:
+        func_name: Aggregation function name, e.g. ``sum_if``
+        field_expr: Its argument, e.g. ``amount, status == paid``
+
+    Returns:
+        (base function, field, condition) for conditional sum, avg and
+        count, or None for anything else
+    """
+    if "_if" not in func_name:
+        return None
+    if "," not in field_expr:
+        # count_if(status == active); other bases also count here
+        return "count", "", field_expr
+    base_func = func_name.replace("_if", "")
+    if base_func not in ("sum", "avg", "count"):
+        return None
+    field, condition = field_expr.split(",", 1)
+    return base_func, field.strip(), condition.strip()
+
+
+class _NumberColumn:
+    """Per-group running sum/avg/min/max state for one field expression.
+
+    Values are converted to float as they are added (integers are kept as
+    ints for sum and avg). Minimum and maximum are kept as running values;
+    sum and avg keep each group's numbers so they can be added up with
+    :func:`sum` exactly as the list-based functions do. A non-numeric value
+    is remembered and raised for its group when a result is asked for, as
+    the list-based functions raise.
+    """
+
+    def __init__(self, funcs: set):
+        self.keep_numbers = bool(funcs & {"sum", "avg"})
+        self.track_low = "min" in funcs
+        self.track_high = "max" in funcs
+        self.numbers: List[List[Union[int, float]]] = []
+        self.lows: List[Optional[float]] = []
+        self.highs: List[Optional[float]] = []
+        # First non-numeric value of each group, with its conversion error
+        self.errors: List[Optional[Tuple[Any, Exception]]] = []
+
+    def grow(self, n_groups: int) -> None:
+        """Add empty state for groups up to ``n_groups``."""
+        new = n_groups - len(self.lows)
+        if new > 0:
+            if self.keep_numbers:
+                self.numbers.extend([] for _ in range(new))
+            self.lows.extend([None] * new)
+            self.highs.extend([None] * new)
+            self.errors.extend([None] * new)
+
+    def add(self, row_groups: List[int], values: Iterable[Any]) -> None:
+        """Add each value (None is skipped) to the group of its row."""
+        # Local names for the per-value loop
+        numbers, lows, highs, errors = self.numbers, self.lows, self.highs, self.errors
+        keep_numbers = self.keep_numbers
+        track_low = self.track_low
+        track_high = self.track_high
+        for g, val in zip(row_groups, values):
+            if val is None:
+                continue
+            # Computed values arrive as floats (arithmetic evaluation
+            # converts them), so skip the call for those; plain int fields
+            # are converted below and still added up as ints
+            if type(val) is float:
+                num = addend = val
+            else:
+                try:
+                    num = float(val)
+                except (ValueError, TypeError) as e:
+                    if errors[g] is None:
+                        errors[g] = (val, e)
+                    continue
+                # Integers are added up as ints, as _agg_sum_func does
+                addend = val if isinstance(val, int) else num
+            if keep_numbers:
+                numbers[g].append(addend)
+            # Same tie and NaN behavior as min() and max()
+            if track_low:
+                low = lows[g]
+                if low is None or num < low:
+                    lows[g] = num
+            if track_high:
+                high = highs[g]
+                if high is None or num > high:
+                    highs[g] = num
+
+    def result(self, func_name: str, g: int) -> Optional[Union[int, float]]:
+        """Value of sum, avg, min or max for group ``g``."""
+        error = self.errors[g]
+        if error is not None:
+            value, cause = error
+            raise ValueError(f"Cannot convert value to number: {value!r}") from cause
+        if func_name == "min":
+            return self.lows[g]
+        if func_name == "max":
+            return self.highs[g]
+        numbers = self.numbers[g]
+        if func_name == "sum":
+            return sum(numbers)
+        return sum(numbers) / len(numbers) if numbers else None
+
+
+def aggregate_by_key(
+    data: Iterable[Row], key_func: Callable[[Row], Any], specs: List[Tuple[str, str]]
+) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """Group rows by ``key_func(row)`` and aggregate every group in one pass.
+
+    Rather than collecting each group's rows and aggregating them
+    afterwards, every row updates its group's running state as it is read:
+    a count and the first and last rows. The values of each field
+    expression used by sum/avg/min/max/list are then gathered a column at
+    a time, one pass over the rows per expression, into per-group state
+    indexed by the group number recorded for each row: the values
+    themselves for ``list``, otherwise a :class:`_NumberColumn`.
+    Conditional sum/avg/count (``sum_if`` etc.) likewise keep only the
+    matching values or a count per group. Rows are only kept per group for
+    aggregations that need them, handled by :func:`apply_single_agg`.
+
+    Input that is not a list is consumed once, a slice of rows at a time,
+    so a stream of rows never has to be held in memory as a whole.
+
+    Args:
+        data: List or other iterable of dictionaries
+        key_func: Function returning a row's group key
+        specs: List of (name, expression) tuples
+
+    Returns:
+        Iterator of (group key, aggregation results) tuples, in order of
+        first appearance of each group. The rows are all read by the time
+        this returns; each group's results are computed as it is reached.
+    """
+    parser = ExprEval()
+
+    plan = []
+    # Aggregation functions used with each field expression, in first use order
+    field_funcs: Dict[str, set] = {}
+    keep_rows = False
+    for name, expr in specs:
+        func_name, field_expr = _parse_agg_expr(expr)
+        conditional = None
+        if func_name in _SHARED_VALUE_FUNCS:
+            field_funcs.setdefault(field_expr, set()).add(func_name)
+        elif func_name not in ("count", "first", "last"):
+            conditional = _split_conditional(func_name, field_expr)
+            if conditional is None:
+                keep_rows = True
+        plan.append((name, expr, func_name, field_expr, conditional))
+
+    if all(entry[2] == "count" for entry in plan):
+        # Only row counts are asked for: count the keys, keeping nothing per row
+        counted = Counter(map(key_func, data))
+        return ((key, {entry[0]: n for entry in plan}) for key, n in counted.items())
+
+    index: Dict[Any, int] = {}
+    keys: List[Any] = []
+    counts: List[int] = []
+    firsts: Relation = []
+    lasts: Relation = []
+    group_rows: List[Relation] = []
+
+    # A field expression used by list() keeps its values, in row order,
+    # per group; the numeric aggregations are then computed from them
+    value_funcs = {
+        field_expr: _agg_value_func(field_expr, parser) for field_expr in field_funcs
+    }
+    value_lists: Dict[str, List[List[Any]]] = {}
+    number_columns: Dict[str, _NumberColumn] = {}
+    for field_expr, funcs in field_funcs.items():
+        if "list" in funcs:
+            value_lists[field_expr] = []
+        else:
+            number_columns[field_expr] = _NumberColumn(funcs)
+
+    # Conditional aggregations, by plan position: matching non-null values
+    # per group for sum/avg, or the number of matching rows for count
+    conditional_states: Dict[int, List[Any]] = {
+        i: [] for i, entry in enumerate(plan) if entry[4] is not None
+    }
+
+    # A list is aggregated in one go; rows from any other iterable are read
+    # a slice at a time, so only the per-group state stays in memory
+    if isinstance(data, list):
+        chunks: Iterable[Relation] = [data]
+    else:
+        rows = iter(data)
+        chunks = iter(lambda: list(islice(rows, _CHUNK_ROWS)), [])
+
+    for chunk in chunks:
+        row_groups: List[int] = []
+        for row in chunk:
+            key = key_func(row)
+            g = index.get(key)
+            if g is None:
+                g = index[key] = len(keys)
+                keys.append(key)
+                counts.append(0)
+                firsts.append(row)
+                lasts.append(None)
+                if keep_rows:
+                    group_rows.append([])
+            counts[g] += 1
+            lasts[g] = row
+            row_groups.append(g)
+            if keep_rows:
+                group_rows[g].append(row)
+        n_groups = len(keys)
+
+        for field_expr, value_of in value_funcs.items():
+            values = map(value_of, chunk)
+            if field_expr in value_lists:
+                group_values = value_lists[field_expr]
+                group_values.extend([] for _ in range(n_groups - len(group_values)))
+                for g, val in zip(row_groups, values):
+                    if val is not None:
+                        group_values[g].append(val)
+            else:
+                column = number_columns[field_expr]
+                column.grow(n_groups)
+                column.add(row_groups, values)
+
+        matches_by_condition: Dict[str, List[bool]] = {}
+        for i, state in conditional_states.items():
+            base_func, field, condition = plan[i][4]
+            matches = matches_by_condition.get(condition)
+            if matches is None:
+                evaluate = parser.evaluate
+                matches = matches_by_condition[condition] = [
+                    evaluate(condition, row) for row in chunk
+                ]
+            if base_func == "count":
+                state.extend([0] * (n_groups - len(state)))
+                for g, matched in zip(row_groups, matches):
+                    if matched:
+                        state[g] += 1
+            else:
+                state.extend([] for _ in range(n_groups - len(state)))
+                get_value = parser.compile_path(field)
+                for g, matched, row in zip(row_groups, matches, chunk):
+                    if matched:
+                        val = get_value(row)
+                        if val is not None:
+                            state[g].append(val)
+
+    # Fields whose per-group values a list() result already is
+    listed = set()
+
+    def group_value(
+        i: int,
+        name: str,
+        expr: str,
+        func_name: str,
+        field_expr: str,
+        conditional: Optional[Tuple[str, str, str]],
+    ) -> Callable[[int], Any]:
+        """Function from a group's position to one aggregation's value."""
+        if func_name in _SHARED_VALUE_FUNCS:
+            column = number_columns.get(field_expr)
+            if column is not None:
+                return lambda g: column.result(func_name, g)
+            group_values = value_lists[field_expr]
+            if func_name == "list":
+                # Each list() result gets a list of its own
+                if field_expr in listed:
+                    return lambda g: group_values[g].copy()
+                listed.add(field_expr)
+                return group_values.__getitem__
+            agg_func = AGGREGATION_FUNCTIONS[func_name]
+            return lambda g: agg_func(group_values[g])
+        if func_name == "count":
+            return counts.__getitem__
+        if func_name in ("first", "last"):
+            rows = firsts if func_name == "first" else lasts
+            if not field_expr:
+                return rows.__getitem__
+            get_value = parser.compile_path(field_expr)
+            return lambda g: get_value(rows[g])
+        if conditional is not None:
+            state = conditional_states[i]
+            if conditional[0] == "count":
+                return state.__getitem__
+            if conditional[0] == "sum":
+                return lambda g: sum(state[g])
+            return lambda g: sum(state[g]) / len(state[g]) if state[g] else 0
+        return lambda g: apply_single_agg((name, expr), group_rows[g])[name]
+
+    # Dispatch on the aggregation function once, not once per group
+    getters = []
+    for i, (name, expr, func_name, field_expr, conditional) in enumerate(plan):
+        getter = group_value(i, name, expr, func_name, field_expr, conditional)
+        getters.append((name, getter))
+    return (
+        (key, {name: get(g) for name, get in getters}) for g, key in enumerate(keys)
+    )
+
+
 def aggregate_single_group(data: Relation, agg_spec: str) -> Dict[str, Any]:
     """Aggregate ungrouped data as a single group.
 
@@ -217,13 +741,7 @@ def aggregate_single_group(data: Relation, agg_spec: str) -> Dict[str, Any]:
     Returns:
         Dictionary with aggregation results
     """
-    agg_specs = parse_agg_specs(agg_spec)
-    result = {}
-
-    for spec in agg_specs:
-        result.update(apply_single_agg(spec, data))
-
-    return result
+    return apply_aggs(parse_agg_specs(agg_spec), data)
 
 def aggregate_grouped_data(grouped_data: Relation, agg_spec: str) -> Relation:
     """Aggregate data that has group metadata.
@@ -235,29 +753,40 @@ def aggregate_grouped_data(grouped_data: Relation, agg_spec: str) -> Relation:
     Returns:
         List of aggregated results
     """
-    from collections import defaultdict
-    
     # Group by the combination of all grouping fields
-    groups = defaultdict(list)
+    groups: Dict[Tuple[Any, ...], Relation] = {}
     group_keys = {}
+    # Metadata keys of each row layout (its keys, in order), found once
+    # per layout rather than by testing every key of every row
+    metadata_keys: Dict[Tuple[str, ...], List[str]] = {}
 
     for row in grouped_data:
         # Use the _groups list to create a grouping key
         groups_list = row.get("_groups", [])
         
         # Create a tuple key for internal grouping
-        group_tuple = tuple((g["field"], g["value"]) for g in groups_list)
+        group_tuple = tuple([(g["field"], g["value"]) for g in groups_list])
         
-        # Store the groups for this tuple
-        if group_tuple not in group_keys:
+        # One lookup per row; the groups are stored on first sight
+        group_rows = groups.get(group_tuple)
+        if group_rows is None:
+            group_rows = groups[group_tuple] = []
             group_keys[group_tuple] = groups_list
 
         # Remove metadata for aggregation
-        clean_row = {k: v for k, v in row.items() if not k.startswith("_group")}
-        groups[group_tuple].append(clean_row)
-
-    # Apply aggregations
+        layout = tuple(row)
+        drop = metadata_keys.get(layout)
+        if drop is None:
+            drop = metadata_keys[layout] = [k for k in layout if k.startswith("_group")]
+        clean_row = row.copy()
+        for k in drop:
+            del clean_row[k]
+        group_rows.append(clean_row)
+
+    # Apply aggregations, resolved once for all groups
     result = []
+    parser = ExprEval()
+    plan = _plan_aggs(parse_agg_specs(agg_spec), parser)
 
     for group_tuple, group_rows in groups.items():
         # Start with all grouping fields
@@ -267,10 +796,7 @@ def aggregate_grouped_data(grouped_data: Relation, agg_spec: str) -> Relation:
         for group_info in group_keys[group_tuple]:
             agg_result[group_info["field"]] = group_info["value"]
 
-        # Parse and apply aggregations
-        agg_specs = parse_agg_specs(agg_spec)
-        for spec in agg_specs:
-            agg_result.update(apply_single_agg(spec, group_rows))
+        agg_result.update(_apply_agg_plan(plan, group_rows, parser))
 
         result.append(agg_result)
 
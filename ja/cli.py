@@ -245,6 +245,11 @@ def main():
         sp_sort.add_argument(
             "--desc", action="store_true", help="Sort in descending order"
         )
+        sp_sort.add_argument(
+            "--limit",
+            type=int,
+            help="Only output the first N rows of the sorted result",
+        )
 
         # groupby
         sp_groupby = subparsers.add_parser(
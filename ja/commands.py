@@ -9,22 +9,21 @@ import json
 import sys
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import jmespath.exceptions
 
 from .core import (
     collect,
-    difference,
-    distinct,
-    intersection,
+    idifference,
+    idistinct,
+    iintersection,
+    iproduct,
     join,
-    product,
     project,
     rename,
     select,
     sort_by,
-    union,
 )
 from .window import (
     row_number,
@@ -39,7 +38,7 @@ from .window import (
     cume_dist,
 )
 from .group import (
-    groupby_agg,
+    igroupby_agg,
     groupby_chained,
     groupby_with_metadata,
 )
@@ -47,6 +46,7 @@ from .agg import (
     aggregate_grouped_data,
     aggregate_single_group,
 )
+from .fastjson import loads
 from .export import dir_to_jsonl, json_array_to_jsonl_lines, jsonl_to_dir, jsonl_to_json_array_string
 from .exporter import jsonl_to_csv_stream
 from .importer import csv_to_jsonl_lines
@@ -73,13 +73,39 @@ def get_input_stream(file_path):
 
 def read_jsonl(input_stream) -> List[Dict[str, Any]]:
     """Read JSONL data from a file-like object."""
-    return [json.loads(line) for line in input_stream]
+    return [loads(line) for line in input_stream]
 
 
-def write_jsonl(rows: List[Dict[str, Any]]) -> None:
+def iter_jsonl(input_stream) -> Iterator[Dict[str, Any]]:
+    """Lazily read JSONL data from a file-like object, one row at a time."""
+    for line in input_stream:
+        yield loads(line)
+
+
+def write_lines(lines: Iterable[str], batch_size: int = 256) -> None:
+    """Write lines to stdout, joining them into one write per batch.
+
+    Lines already produced are written out even if *lines* raises. On a
+    terminal each line is written as soon as it is produced.
+    """
+    if sys.stdout.isatty():
+        batch_size = 1
+    write = sys.stdout.write
+    batch: List[str] = []
+    try:
+        for line in lines:
+            batch.append(line)
+            if len(batch) >= batch_size:
+                write("\n".join(batch) + "\n")
+                batch.clear()
+    finally:
+        if batch:
+            write("\n".join(batch) + "\n")
+
+
+def write_jsonl(rows: Iterable[Dict[str, Any]]) -> None:
     """Write a collection of objects as JSONL to stdout."""
-    for row in rows:
-        print(json.dumps(row))
+    write_lines(map(json.dumps, rows))
 
 
 def write_json_object(obj: Any) -> None:
@@ -155,13 +181,11 @@ def handle_join(args):
 
 def handle_product(args):
     """Handle product command."""
-    with get_input_stream(args.left) as f:
-        left_data = read_jsonl(f)
     with get_input_stream(args.right) as f:
         right_data = read_jsonl(f)
-
-    result = product(left_data, right_data)
-    write_jsonl(result)
+    # Stream the left side straight through to stdout
+    with get_input_stream(args.left) as f:
+        write_jsonl(iproduct(iter_jsonl(f), right_data))
 
 
 def handle_rename(args):
@@ -189,43 +213,33 @@ def handle_rename(args):
 def handle_union(args):
     """Handle union command."""
     with get_input_stream(args.left) as f:
-        left_data = read_jsonl(f)
+        write_jsonl(iter_jsonl(f))
     with get_input_stream(args.right) as f:
-        right_data = read_jsonl(f)
-
-    result = union(left_data, right_data)
-    write_jsonl(result)
+        write_jsonl(iter_jsonl(f))
 
 
 def handle_intersection(args):
     """Handle intersection command."""
-    with get_input_stream(args.left) as f:
-        left_data = read_jsonl(f)
     with get_input_stream(args.right) as f:
         right_data = read_jsonl(f)
-
-    result = intersection(left_data, right_data)
-    write_jsonl(result)
+    # Stream the left side straight through to stdout
+    with get_input_stream(args.left) as f:
+        write_jsonl(iintersection(iter_jsonl(f), right_data))
 
 
 def handle_difference(args):
     """Handle difference command."""
-    with get_input_stream(args.left) as f:
-        left_data = read_jsonl(f)
     with get_input_stream(args.right) as f:
         right_data = read_jsonl(f)
-
-    result = difference(left_data, right_data)
-    write_jsonl(result)
+    # Stream the left side straight through to stdout
+    with get_input_stream(args.left) as f:
+        write_jsonl(idifference(iter_jsonl(f), right_data))
 
 
 def handle_distinct(args):
     """Handle distinct command."""
     with get_input_stream(args.file) as f:
-        data = read_jsonl(f)
-
-    result = distinct(data)
-    write_jsonl(result)
+        write_jsonl(idistinct(iter_jsonl(f)))
 
 
 def handle_sort(args):
@@ -233,26 +247,26 @@ def handle_sort(args):
     with get_input_stream(args.file) as f:
         data = read_jsonl(f)
 
-    result = sort_by(data, args.keys, descending=args.desc)
+    result = sort_by(data, args.keys, descending=args.desc, limit=args.limit)
     write_jsonl(result)
 
 
 def handle_groupby(args):
     """Handle groupby command."""
     with get_input_stream(args.file) as f:
+        if hasattr(args, "agg") and args.agg:
+            # Traditional groupby with aggregation, reading rows as it goes
+            write_jsonl(igroupby_agg(iter_jsonl(f), args.key, args.agg))
+            return
         data = read_jsonl(f)
 
-    if hasattr(args, "agg") and args.agg:
-        # Traditional groupby with aggregation
-        result = groupby_agg(data, args.key, args.agg)
+    # Check if input is already grouped - look for new format
+    if data and "_groups" in data[0]:
+        # This is a chained groupby
+        result = groupby_chained(data, args.key)
     else:
-        # Check if input is already grouped - look for new format
-        if data and "_groups" in data[0]:
-            # This is a chained groupby
-            result = groupby_chained(data, args.key)
-        else:
-            # First groupby
-            result = groupby_with_metadata(data, args.key)
+        # First groupby
+        result = groupby_with_metadata(data, args.key)
 
     write_jsonl(result)
 
@@ -323,10 +337,9 @@ def handle_explode(args):
 def handle_implode(args):
     """Handle implode command."""
     try:
-        for line in dir_to_jsonl(
-            args.input_dir, args.add_filename_key, args.recursive
-        ):
-            print(line)
+        write_lines(
+            dir_to_jsonl(args.input_dir, args.add_filename_key, args.recursive)
+        )
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
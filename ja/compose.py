@@ -9,7 +9,7 @@ from functools import reduce
 import itertools
 
 from .core import Row, Relation
-from .core import select, project, rename, distinct, sort_by
+from .core import select, project, rename, distinct, idistinct, sort_by
 from .group import groupby_agg, groupby_with_metadata
 from .expr import ExprEval
 
@@ -32,14 +32,20 @@ class Pipeline:
         ... )
         >>> result = pipeline(data)
 
-        >>> # Lazy evaluation for large datasets
+        >>> # Lazy evaluation for large datasets: rows stream through one
+        >>> # at a time, and reading stops once Take has its 1000 rows
         >>> lazy_pipeline = (
         ...     Pipeline(lazy=True)
         ...     | Select("status == 'active'")
         ...     | Take(1000)
         ... )
-        >>> for row in lazy_pipeline(huge_data):
+        >>> rows = (json.loads(line) for line in open("huge.jsonl"))
+        >>> for row in lazy_pipeline(rows):
         ...     process(row)
+
+    Sort and GroupBy need every row, so they materialize their input even
+    in a lazy pipeline; a GroupBy with an aggregation only keeps its
+    per-group results.
     """
 
     def __init__(self, *ops: Callable, lazy: bool = False):
@@ -74,19 +80,34 @@ class Pipeline:
         Returns:
             Transformed data (list or iterator based on lazy flag)
         """
+        ops = self._plan()
         if self.lazy:
-            # Lazy evaluation - return generator
-            result = iter(data) if not hasattr(data, '__iter__') else data
-            for op in self.ops:
+            # Lazy evaluation - return generator; lists are iterated too, so
+            # that operations stream rather than build intermediate lists
+            result = iter(data)
+            for op in ops:
                 result = op(result)
             return result
         else:
             # Eager evaluation - return list
             result = list(data) if hasattr(data, '__iter__') else data
-            for op in self.ops:
+            for op in ops:
                 result = op(result)
             return result
 
+    def _plan(self) -> List[Callable]:
+        """Operations to run, after pushing limits down into sorts.
+
+        A Sort directly followed by Take(n) only needs the n first rows, so
+        it is run with ``limit=n``, which avoids sorting everything.
+        """
+        ops = list(self.ops)
+        for i in range(len(ops) - 1):
+            op, next_op = ops[i], ops[i + 1]
+            if isinstance(op, Sort) and isinstance(next_op, Take) and op.limit is None:
+                ops[i] = Sort(op.keys, op.descending, limit=next_op.n)
+        return ops
+
     def __repr__(self) -> str:
         """String representation of pipeline."""
         op_names = [op.__class__.__name__ if hasattr(op, '__class__') else str(op)
@@ -125,15 +146,17 @@ class Select(Operation):
 
     def _lazy_select(self, data: Iterator[Row]) -> Iterator[Row]:
         """Lazy evaluation of select."""
-        parser = ExprEval()
-        for row in data:
-            if self.use_jmespath:
-                import jmespath
-                compiled_expr = jmespath.compile(self.expr)
-                if compiled_expr.search(row):
+        if self.use_jmespath:
+            import jmespath
+            search = jmespath.compile(self.expr).search
+            for row in data:
+                if search(row):
+                    yield row
+        else:
+            predicate = ExprEval().compile(self.expr)
+            for row in data:
+                if predicate(row):
                     yield row
-            elif parser.evaluate(self.expr, row):
-                yield row
 
     def __repr__(self) -> str:
         return f"Select('{self.expr}')"
@@ -185,13 +208,16 @@ class Project(Operation):
 class Sort(Operation):
     """Composable sort operation."""
 
-    def __init__(self, keys: Union[str, List[str]], descending: bool = False):
+    def __init__(self, keys: Union[str, List[str]], descending: bool = False,
+                 limit: Optional[int] = None):
         self.keys = keys
         self.descending = descending
+        self.limit = limit
 
     def __call__(self, data: Union[Relation, Iterator[Row]]) -> Relation:
         # Sorting requires materializing the entire dataset
-        return sort_by(list(data), self.keys, descending=self.descending)
+        return sort_by(list(data), self.keys, descending=self.descending,
+                       limit=self.limit)
 
     def __repr__(self) -> str:
         keys_str = self.keys if isinstance(self.keys, str) else ",".join(self.keys)
@@ -200,11 +226,19 @@ class Sort(Operation):
 
 
 class Distinct(Operation):
-    """Composable distinct operation."""
+    """Composable distinct operation.
 
-    def __call__(self, data: Union[Relation, Iterator[Row]]) -> Relation:
-        # Distinct requires materializing to check uniqueness
-        return distinct(list(data))
+    Pass ``presorted=True`` when duplicate rows are known to be adjacent.
+    """
+
+    def __init__(self, presorted: bool = False):
+        self.presorted = presorted
+
+    def __call__(self, data: Union[Relation, Iterator[Row]]) -> Union[Relation, Iterator[Row]]:
+        if hasattr(data, '__iter__') and not isinstance(data, list):
+            # Lazy evaluation only keeps the keys of rows seen so far
+            return idistinct(data, self.presorted)
+        return distinct(list(data), self.presorted)
 
     def __repr__(self) -> str:
         return "Distinct()"
@@ -242,12 +276,12 @@ class GroupBy(Operation):
         self.agg = agg
 
     def __call__(self, data: Union[Relation, Iterator[Row]]) -> Relation:
-        # Grouping requires materializing the entire dataset
-        data_list = list(data)
         if self.agg:
-            return groupby_agg(data_list, self.key, self.agg)
+            # Aggregation consumes the rows as they come
+            return groupby_agg(data, self.key, self.agg)
         else:
-            return groupby_with_metadata(data_list, self.key)
+            # Grouping with metadata requires materializing the entire dataset
+            return groupby_with_metadata(list(data), self.key)
 
     def __repr__(self) -> str:
         if self.agg:
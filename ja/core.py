@@ -7,17 +7,30 @@ JSONL data.
 """
 
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple, Union
-import re
+from functools import lru_cache
+import heapq
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import json
 
 import jmespath
 
 from .expr import ExprEval
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
 Row = Dict[str, Any]
 Relation = List[Row]
 
 
+@lru_cache(maxsize=1024)
+def _sorted_keys(keys: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Sorted order of a dict's keys, cached since rows mostly share a schema."""
+    return tuple(sorted(keys))
+
+
 def _row_to_hashable_key(row: Row) -> tuple:
     """Convert a dictionary row to a canonical hashable representation.
 
@@ -37,21 +50,23 @@ def _row_to_hashable_key(row: Row) -> tuple:
 
     def to_hashable(obj: Any) -> Any:
         if isinstance(obj, dict):
-            return tuple(sorted((k, to_hashable(v)) for k, v in obj.items()))
+            return tuple((k, to_hashable(obj[k])) for k in _sorted_keys(tuple(obj)))
         if isinstance(obj, list):
             return tuple(to_hashable(v) for v in obj)
-        # Let it fail for unhashable types like sets
-        hash(obj)
         return obj
 
     try:
         # We are converting the whole row dict into a hashable tuple of items.
-        return to_hashable(row)  # type: ignore[no-any-return]
+        # Hashing the finished key once checks every leaf value in C; unhashable
+        # types like sets make it fail.
+        key = to_hashable(row)
+        hash(key)
+        return key  # type: ignore[no-any-return]
     except TypeError as e:
         # Find the problematic item to create a better error message
         for k, v in row.items():
             try:
-                to_hashable(v)
+                hash(to_hashable(v))
             except TypeError:
                 raise TypeError(
                     f"Row cannot be converted to a hashable key because it contains an unhashable value. "
@@ -62,6 +77,39 @@ def _row_to_hashable_key(row: Row) -> tuple:
         raise e
 
 
+def _row_key(row: Row) -> Any:
+    """Return the key used to compare whole rows in set operations.
+
+    Rows are serialized to canonical JSON (sorted keys, compact separators),
+    which is done entirely in C and handles nested dicts and lists without
+    building intermediate tuples. ``orjson`` is used when installed; since
+    it writes NaN and infinities as ``null``, rows whose output contains
+    ``null`` are keyed with the standard library encoder instead, which
+    keeps them apart. Rows holding values JSON cannot represent fall back
+    to :func:`_row_to_hashable_key`.
+
+    Rows are equal when their JSON is, so unlike Python equality:
+
+    - ``1``, ``1.0`` and ``True`` are all different values,
+    - ``0.0`` and ``-0.0`` are different values,
+    - every NaN equals every other NaN.
+
+    Args:
+        row: A dictionary representing a row of data.
+
+    Returns:
+        A hashable key; equal rows produce equal keys.
+    """
+    try:
+        if orjson is not None:
+            key = orjson.dumps(row, option=orjson.OPT_SORT_KEYS)
+            if b"null" not in key:
+                return key
+        return json.dumps(row, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return _row_to_hashable_key(row)
+
+
 def select(
     data: Relation, expr: str, use_jmespath: bool = False
 ) -> Relation:
@@ -76,33 +124,43 @@ def select(
         List of rows where the expression evaluates to true
     """
     if use_jmespath:
-        compiled_expr = jmespath.compile(expr)
-        return [row for row in data if compiled_expr.search(row)]
+        return select_compiled(data, _compile_jmespath(expr))
 
-    # Use simple expression parser
-    parser = ExprEval()
-    result = []
+    return list(filter(_compile_predicate(expr), data))
 
-    # Handle 'and' at the command level for simplicity
-    if " and " in expr:
-        # Multiple conditions with 'and'
-        conditions = expr.split(" and ")
-        for row in data:
-            if all(parser.evaluate(cond.strip(), row) for cond in conditions):
-                result.append(row)
-    elif " or " in expr:
-        # Multiple conditions with 'or'
-        conditions = expr.split(" or ")
-        for row in data:
-            if any(parser.evaluate(cond.strip(), row) for cond in conditions):
-                result.append(row)
-    else:
-        # Single condition
-        for row in data:
-            if parser.evaluate(expr, row):
-                result.append(row)
 
-    return result
+@lru_cache(maxsize=256)
+def _compile_predicate(expr: str) -> Callable[[Row], bool]:
+    """Compiled predicate for a simple expression, shared across calls."""
+    return ExprEval().compile(expr)
+
+
+@lru_cache(maxsize=512)
+def _compile_jmespath(expr: str) -> Any:
+    """Compiled JMESPath expression, shared across calls.
+
+    Callers holding an already compiled expression can use
+    :func:`select_compiled` and skip the cache lookup.
+    """
+    return jmespath.compile(expr)
+
+
+def select_compiled(data: Relation, compiled_expr: Any) -> Relation:
+    """Filter rows with an already compiled JMESPath expression.
+
+    Pipelines that apply the same filter to many batches should compile the
+    expression once with ``jmespath.compile`` and call this function, which
+    skips the parsing done by :func:`select`.
+
+    Args:
+        data: List of dictionaries to filter
+        compiled_expr: Result of ``jmespath.compile``
+
+    Returns:
+        List of rows where the expression evaluates to true
+    """
+    search = compiled_expr.search
+    return [row for row in data if search(row)]
 
 
 def project(
@@ -120,37 +178,60 @@ def project(
     """
 
     if use_jmespath:
-        compiled_expr = jmespath.compile(fields)
+        compiled_expr = _compile_jmespath(fields)
         return [compiled_expr.search(row) for row in data]
 
-    # Parse field specifications
-    result = []
+    # Parse field specifications once per call rather than once per row.
+    # Computed fields become (name, expr, None); plain fields become
+    # (key, path, getter) with the path compiled once, and key set when the
+    # value can be stored at the top level without building nested dicts.
     parser = ExprEval()
     field_specs = fields if isinstance(fields, list) else fields.split(",")
+    plan: List[Tuple[Optional[str], str, Optional[Callable[[Row], Any]]]] = []
+    for spec in field_specs:
+        if "=" in spec:
+            # Computed field: "total=amount*1.1" or "is_adult=age>=18"
+            name, expr = spec.split("=", 1)
+            plan.append((name.strip(), expr.strip(), None))
+        else:
+            key = spec if spec and "." not in spec else None
+            plan.append((key, spec, parser.compile_path(spec)))
+
+    if len(plan) == 1 and plan[0][0] is not None and plan[0][2] is not None:
+        # A single top-level field (e.g. ``project id``) needs no per-row
+        # walk over the plan. (Fetching several fields at once with
+        # itemgetter and dict(zip(...)) measured no faster than the loop.)
+        key, _, get_value = plan[0]
+        return [
+            {} if value is None else {key: value}
+            for value in map(get_value, data)
+        ]
 
+    evaluate_arithmetic = parser.evaluate_arithmetic
+    evaluate = parser.evaluate
+    set_field_value = parser.set_field_value
+    result = []
     for row in data:
-        new_row = {}
-
-        for spec in field_specs:
-            if "=" in spec:
-                # Computed field: "total=amount*1.1" or "is_adult=age>=18"
-                name, expr = spec.split("=", 1)
-                name = name.strip()
-                expr = expr.strip()
+        new_row: Row = {}
 
+        for name, expr, get_value in plan:
+            if get_value is None:
                 # Check if it's an arithmetic expression
-                arith_result = parser.evaluate_arithmetic(expr, row)
+                arith_result = evaluate_arithmetic(expr, row)
                 if arith_result is not None:
                     new_row[name] = arith_result
                 else:
                     # Try as boolean expression
-                    new_row[name] = parser.evaluate(expr, row)
+                    new_row[name] = evaluate(expr, row)
             else:
                 # Simple field projection
-                value = parser.get_field_value(row, spec)
+                value = get_value(row)
                 if value is not None:
-                    # Build nested structure
-                    parser.set_field_value(new_row, spec, value)
+                    if name is not None:
+                        new_row[name] = value
+                    else:
+                        # Build nested structure
+                        set_field_value(new_row, expr, value)
 
         result.append(new_row)
 
@@ -158,6 +239,11 @@ def project(
 
 
 # --- join --------------------------------------------------------------------
+def _path_root(path: str) -> str:
+    """First component of a field path (e.g. 'user.id' → 'user')."""
+    return path.partition(".")[0].partition("[")[0]
+
+
 def join(left: Relation,
          right: Relation,
          on: List[Tuple[str, str]],
@@ -185,6 +271,18 @@ def join(left: Relation,
         [{"id": 1, "name": "Alice", "order": "Book"},
          {"id": 2, "name": "Bob", "order": None}]
     """
+    return list(ijoin(left, right, on, how))
+
+
+def ijoin(left: Relation,
+          right: Relation,
+          on: List[Tuple[str, str]],
+          how: str = "inner") -> Iterator[Row]:
+    """Join two relations, yielding joined rows as they are produced.
+
+    Same as :func:`join`, but the output is not collected into a list.
+    The inputs are still read in full to build the hash table.
+    """
     how = how.lower()
     valid_types = {"inner", "left", "right", "outer", "cross"}
     if how not in valid_types:
@@ -192,104 +290,240 @@ def join(left: Relation,
 
     # Cross join is special - no key matching
     if how == "cross":
-        return product(left, right)
+        return iproduct(left, right)
+
+    return _join_rows(left, right, on, how)
 
+
+def _join_rows(left: Relation,
+               right: Relation,
+               on: List[Tuple[str, str]],
+               how: str) -> Iterator[Row]:
+    """Generate the rows of a keyed (non-cross) join."""
     parser = ExprEval()
 
-    # Index right side by join keys
-    right_index: Dict[Tuple[Any, ...], List[Row]] = defaultdict(list)
-    for r in right:
-        key = tuple(parser.get_field_value(r, rk) for _, rk in on)
-        if all(v is not None for v in key):
-            right_index[key].append(r)
+    def key_extractor(paths: List[str]) -> Callable[[Row], Any]:
+        """Build a function returning a row's join key, or None if null.
+
+        Paths are compiled once. Single-column joins key on the bare value,
+        which skips building and hashing a 1-tuple for every row on both
+        sides.
+        """
+        getters = [parser.compile_path(p) for p in paths]
+        if len(getters) == 1:
+            return getters[0]
+
+        def extract(row: Row) -> Optional[Tuple[Any, ...]]:
+            key = tuple(get(row) for get in getters)
+            return key if all(v is not None for v in key) else None
+
+        return extract
+
+    left_key = key_extractor([lk for lk, _ in on])
+    right_key = key_extractor([rk for _, rk in on])
 
     # Roots of every RHS join path (e.g. 'user.id' → 'user')
-    rhs_roots = {re.split(r"[.\[]", rk, 1)[0] for _, rk in on}
+    rhs_roots = frozenset(_path_root(rk) for _, rk in on)
 
     # Get all right-side field names for null placeholders
     right_fields: set[str] = set()
-    for r in right:
-        right_fields.update(r.keys())
-    # Remove join key roots from right fields
-    right_fields -= rhs_roots
+    if how in ("left", "outer"):
+        for r in right:
+            right_fields.update(r.keys())
+        # Remove join key roots from right fields
+        right_fields -= rhs_roots
 
     # Get all left-side field names for null placeholders
     left_fields: set[str] = set()
-    for left_row in left:
-        left_fields.update(left_row.keys())
+    if how in ("right", "outer"):
+        for left_row in left:
+            left_fields.update(left_row.keys())
+
+    # Null placeholders are the same for every unmatched row
+    right_nulls = dict.fromkeys(right_fields)
+    left_nulls = dict.fromkeys(left_fields)
+
+    # Whether a right-side key survives the merge, i.e. its root is not a
+    # join key root; memoized since right rows mostly share their keys
+    right_key_kept: Dict[str, bool] = {}
+
+    def keep_right_key(k: str) -> bool:
+        keep = right_key_kept.get(k)
+        if keep is None:
+            keep = right_key_kept[k] = _path_root(k) not in rhs_roots
+        return keep
 
     def merge_rows(l_row: Optional[Row], r_row: Optional[Row]) -> Row:
         """Merge left and right rows, handling nulls."""
-        merged = {}
-
         if r_row is not None:
-            for k, v in r_row.items():
-                # Skip right-side join key roots
-                root = re.split(r"[.\[]", k, 1)[0]
-                if root not in rhs_roots:
-                    merged[k] = v
+            # Skip right-side join key roots
+            merged = {k: v for k, v in r_row.items() if keep_right_key(k)}
         else:
             # No right match - add null placeholders for right fields
-            for field in right_fields:
-                merged[field] = None
+            merged = right_nulls.copy()
 
         if l_row is not None:
             merged.update(l_row)  # Left wins on collision
         else:
             # No left match - add null placeholders for left fields
-            for field in left_fields:
-                merged[field] = None
+            merged.update(left_nulls)
 
         return merged
 
-    joined: Relation = []
+    keep_unmatched_left = how in ("left", "outer")
+    keep_unmatched_right = how in ("right", "outer")
+
+    if len(left) < len(right):
+        # Build the hash table on the smaller left side and probe with right.
+        # Matches are bucketed per left row and emitted in left order, so the
+        # output is identical to probing with left.
+        left_index: Dict[Any, List[int]] = {}
+        index_setdefault = left_index.setdefault
+        for i, left_row in enumerate(left):
+            l_key = left_key(left_row)
+            if l_key is not None:
+                index_setdefault(l_key, []).append(i)
+
+        buckets: Dict[int, List[Row]] = {}
+        bucket_setdefault = buckets.setdefault
+        probe = left_index.get
+        unmatched_right: Relation = []
+        for r in right:
+            r_key = right_key(r)
+            if r_key is None:
+                continue
+            positions = probe(r_key)
+            if positions is None:
+                if keep_unmatched_right:
+                    unmatched_right.append(r)
+                continue
+            for i in positions:
+                bucket_setdefault(i, []).append(r)
+
+        for i, left_row in enumerate(left):
+            bucket = buckets.get(i)
+            if bucket is not None:
+                for r in bucket:
+                    yield merge_rows(left_row, r)
+            elif keep_unmatched_left:
+                yield merge_rows(left_row, None)
+
+        for r in unmatched_right:
+            yield merge_rows(None, r)
+
+        return
+
+    # Index right side by join keys. While the keys stay unique (the usual
+    # primary-key case) each entry holds the bare row; on the first duplicate
+    # key every entry is promoted to a list of rows. Keys are kept alongside
+    # the rows for the unmatched-right pass so each is extracted only once.
+    right_index: Dict[Any, Any] = {}
+    unique_right = True
+    right_keys: List[Any] = []
+    index_setdefault = right_index.setdefault
+    for r in right:
+        key = right_key(r)
+        if keep_unmatched_right:
+            right_keys.append(key)
+        if key is not None:
+            if unique_right:
+                if key not in right_index:
+                    right_index[key] = r
+                    continue
+                unique_right = False
+                right_index = {k: [v] for k, v in right_index.items()}
+                index_setdefault = right_index.setdefault
+            index_setdefault(key, []).append(r)
+
     matched_right_keys: set = set()
+    mark_matched = matched_right_keys.add
+    probe = right_index.get
 
     # Process left side
     for left_row in left:
-        l_key = tuple(parser.get_field_value(left_row, lk) for lk, _ in on)
+        l_key = left_key(left_row)
 
         # Skip rows with null join keys for inner join
-        if not all(v is not None for v in l_key):
-            if how in ("left", "outer"):
+        if l_key is None:
+            if keep_unmatched_left:
                 # Include unmatched left rows for left/outer joins
-                joined.append(merge_rows(left_row, None))
+                yield merge_rows(left_row, None)
             continue
 
-        matches = right_index.get(l_key, [])
+        matches = probe(l_key)
 
-        if matches:
-            matched_right_keys.add(l_key)
-            for r in matches:
-                joined.append(merge_rows(left_row, r))
-        elif how in ("left", "outer"):
+        if matches is not None:
+            mark_matched(l_key)
+            if unique_right:
+                yield merge_rows(left_row, matches)
+            else:
+                for r in matches:
+                    yield merge_rows(left_row, r)
+        elif keep_unmatched_left:
             # No match but include left row for left/outer joins
-            joined.append(merge_rows(left_row, None))
+            yield merge_rows(left_row, None)
 
     # For right and outer joins, add unmatched right rows
-    if how in ("right", "outer"):
-        for r in right:
-            r_key = tuple(parser.get_field_value(r, rk) for _, rk in on)
-            if all(v is not None for v in r_key) and r_key not in matched_right_keys:
-                joined.append(merge_rows(None, r))
-
-    return joined
+    if keep_unmatched_right:
+        for r, r_key in zip(right, right_keys):
+            if r_key is not None and r_key not in matched_right_keys:
+                yield merge_rows(None, r)
 
 
 # --- product -----------------------------------------------------------------
+def _product_keys(
+    left_keys: Any, right_keys: Tuple[str, ...]
+) -> Optional[Tuple[str, ...]]:
+    """Output names for *right_keys* when merged onto a row with *left_keys*.
+
+    Returns None when the schemas are disjoint and nothing needs renaming.
+    """
+    if left_keys.isdisjoint(right_keys):
+        return None
+    seen = set(left_keys)
+    out = []
+    for k in right_keys:
+        name = f"b_{k}" if k in seen else k
+        seen.add(name)
+        out.append(name)
+    return tuple(out)
+
+
 def product(left: Relation, right: Relation) -> Relation:
     """Cartesian product; colliding keys from *right* are prefixed with ``b_``."""
-    result: Relation = []
+    return list(iproduct(left, right))
+
+
+def iproduct(left: Relation, right: Relation) -> Iterator[Row]:
+    """Cartesian product yielding rows one at a time, see :func:`product`.
+
+    *left* may be any iterable of rows; *right* is read in full.
+    """
+    # The renamed right keys only depend on the pair of schemas, so they are
+    # worked out whenever the left schema changes rather than per output
+    # cell, and the inner loop just walks the precomputed (names, row) plan.
+    # Disjoint schemas, the common case, merge with a single dict display.
+    right_items = [(tuple(r), r) for r in right]
+    left_keys: Any = None
+    plan: List[Tuple[Optional[Tuple[str, ...]], Row]] = []
     for left_row in left:
-        for r in right:
-            merged = left_row.copy()
-            for k, v in r.items():
-                if k in merged:
-                    merged[f"b_{k}"] = v
-                else:
-                    merged[k] = v
-            result.append(merged)
-    return result
+        if left_keys is None or left_row.keys() != left_keys:
+            left_keys = left_row.keys()
+            renamed: Dict[Tuple[str, ...], Optional[Tuple[str, ...]]] = {}
+            plan = []
+            for r_keys, right_row in right_items:
+                try:
+                    names = renamed[r_keys]
+                except KeyError:
+                    names = renamed[r_keys] = _product_keys(left_keys, r_keys)
+                plan.append((names, right_row))
+        for names, right_row in plan:
+            if names is None:
+                yield {**left_row, **right_row}
+            else:
+                merged = left_row.copy()
+                merged.update(zip(names, right_row.values()))
+                yield merged
 
 
 def rename(data: Relation, mapping: Dict[str, str]) -> Relation:
@@ -303,12 +537,20 @@ def rename(data: Relation, mapping: Dict[str, str]) -> Relation:
         List with renamed fields
     """
     result = []
+    old_names = mapping.keys()
+    get_name = mapping.get
+    # New key names per row schema (the ordered tuple of its keys)
+    names_for: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
     for row in data:
-        new_row = {}
-        for key, value in row.items():
-            new_key = mapping.get(key, key)
-            new_row[new_key] = value
-        result.append(new_row)
+        if old_names.isdisjoint(row):
+            # Nothing to rename in this row; a plain copy is done in C
+            result.append(dict(row))
+            continue
+        keys = tuple(row)
+        names = names_for.get(keys)
+        if names is None:
+            names = names_for[keys] = tuple(get_name(k, k) for k in keys)
+        result.append(dict(zip(names, row.values())))
     return result
 
 
@@ -327,9 +569,39 @@ def union(
     return left + right
 
 
+def iunion(left: Iterable[Row], right: Iterable[Row]) -> Iterator[Row]:
+    """Yield the rows of *left* followed by those of *right*."""
+    yield from left
+    yield from right
+
+
 def _row_set(data: Relation) -> set:
-    """Convert a relation to a set of hashable row tuples for set operations."""
-    return {tuple(sorted(row.items())) for row in data}
+    """Convert a relation to a set of row keys for set operations."""
+    return {_row_key(row) for row in data}
+
+
+def _split_by_membership(left: Relation, right: Relation) -> Tuple[Relation, Relation]:
+    """Split *left* into rows that do and do not appear in *right*.
+
+    Used when *left* is the smaller side: only its keys are held in a set,
+    and *right* is scanned just until every left key has been found.
+    """
+    left_keys = [_row_key(row) for row in left]
+    wanted = set(left_keys)
+    found: set = set()
+    if wanted:
+        for row in right:
+            key = _row_key(row)
+            if key in wanted and key not in found:
+                found.add(key)
+                if len(found) == len(wanted):
+                    break
+
+    inside: Relation = []
+    outside: Relation = []
+    for row, key in zip(left, left_keys):
+        (inside if key in found else outside).append(row)
+    return inside, outside
 
 
 def intersection(
@@ -344,14 +616,20 @@ def intersection(
     Returns:
         Intersection of the two collections
     """
-    right_set = _row_set(right)
+    if len(left) < len(right):
+        return _split_by_membership(left, right)[0]
+    return list(iintersection(left, right))
 
-    result = []
-    for row in left:
-        if tuple(sorted(row.items())) in right_set:
-            result.append(row)
 
-    return result
+def iintersection(left: Iterable[Row], right: Relation) -> Iterator[Row]:
+    """Yield the rows of *left* that also appear in *right*.
+
+    Only *right* is held in memory, as a set of row keys.
+    """
+    right_set = _row_set(right)
+    for row in left:
+        if _row_key(row) in right_set:
+            yield row
 
 
 def difference(
@@ -366,62 +644,148 @@ def difference(
     Returns:
         Elements in left but not in right
     """
-    right_set = _row_set(right)
+    if len(left) < len(right):
+        return _split_by_membership(left, right)[1]
+    return list(idifference(left, right))
 
-    result = []
-    for row in left:
-        if tuple(sorted(row.items())) not in right_set:
-            result.append(row)
 
-    return result
+def idifference(left: Iterable[Row], right: Relation) -> Iterator[Row]:
+    """Yield the rows of *left* that do not appear in *right*.
+
+    Only *right* is held in memory, as a set of row keys.
+    """
+    right_set = _row_set(right)
+    for row in left:
+        if _row_key(row) not in right_set:
+            yield row
 
 
-def distinct(data: Relation) -> Relation:
+def distinct(data: Relation, presorted: bool = False) -> Relation:
     """Remove duplicate rows from a collection.
 
     Args:
         data: List of dictionaries
+        presorted: If True, the caller guarantees that duplicate rows are
+            adjacent (e.g. the input is sorted on every field), so each row
+            only needs comparing with the previous one
 
     Returns:
         List with duplicates removed
     """
-    seen = set()
-    result = []
+    return list(idistinct(data, presorted))
 
-    for row in data:
-        # Convert to tuple for hashability
-        row_tuple = tuple(sorted(row.items()))
-        if row_tuple not in seen:
-            seen.add(row_tuple)
-            result.append(row)
 
-    return result
+def idistinct(data: Iterable[Row], presorted: bool = False) -> Iterator[Row]:
+    """Yield the first occurrence of each distinct row.
+
+    Only the keys of rows seen so far are held in memory, or just the
+    previous row's key when *presorted* is True (see :func:`distinct`).
+    """
+    if presorted:
+        prev_key: Any = None
+        for row in data:
+            key = _row_key(row)
+            if key != prev_key:
+                prev_key = key
+                yield row
+        return
+
+    seen = set()
+    mark_seen = seen.add
+    for row in data:
+        key = _row_key(row)
+        if key not in seen:
+            mark_seen(key)
+            yield row
 
 
 # --- sort_by -----------------------------------------------------------------
+# Shared sort key for missing values; a 1-tuple ranks before any (rank, value)
+# pair and is never compared by value, so nulls mix safely with numbers.
+_NULL_SORT_KEY = (0,)
+
+
+def _other_sort_key(val: Any) -> Tuple[int, str]:
+    """Sort key for a non-null value that is not a number.
+
+    Strings compare natively; containers and other values rank after all
+    strings and compare by their text form.
+    """
+    if type(val) is str:
+        return (2, val)
+    return (3, str(val))
+
+
 def sort_by(data: Relation,
             keys: Union[str, List[str]],
             *,
-            descending: bool = False) -> Relation:
+            descending: bool = False,
+            limit: Optional[int] = None) -> Relation:
 
     key_list = keys.split(",") if isinstance(keys, str) else keys
     key_list = [k.strip() for k in key_list]
 
     parser = ExprEval()
+    get_value = parser.get_field_value
+
+    def compile_sort_key(key: str) -> Callable[[Row], Any]:
+        """Build the per-row sort value function for one key.
+
+        None values sort first, ahead of numbers and then everything else.
+        """
+        if any(op in key for op in "*+-/"):
+            # Arithmetic expression (or a field name that merely looks like
+            # one): keep the general evaluator
+            def arith_val(row: Row) -> Any:
+                arith = parser.evaluate_arithmetic(key, row)
+                if arith is not None:
+                    return (1, arith)
+                val = get_value(row, key)
+                return _NULL_SORT_KEY if val is None else _other_sort_key(val)
+
+            return arith_val
+
+        # Plain field path: look the value up once per row and coerce it the
+        # way evaluate_arithmetic would, without re-scanning the key for
+        # operators. A missing value falls back to the key parsed as a
+        # literal, which is the same for every row and so computed here.
+        try:
+            missing = (1, float(parser.parse_value(key)))
+        except (TypeError, ValueError):
+            missing = _NULL_SORT_KEY
+
+        get_field = parser.compile_path(key)
+
+        def field_val(row: Row) -> Any:
+            val = get_field(row)
+            if val is None:
+                return missing
+            try:
+                return (1, float(val))
+            except (TypeError, ValueError):
+                return _other_sort_key(val)
 
-    def sort_val(row: Row, key: str):
-        arith = parser.evaluate_arithmetic(key, row)
-        if arith is not None:
-            return (False, arith)
-        val = parser.get_field_value(row, key)
-        # None values sort first
-        return (val is not None, str(val) if val is not None else "")
-
-    return sorted(
-        data,
-        key=lambda r: tuple(sort_val(r, k) for k in key_list),
-        reverse=descending,
-    )
+        return field_val
+
+    sort_vals = [compile_sort_key(k) for k in key_list]
+
+    sort_key: Callable[[Row], Any]
+    if len(sort_vals) == 1:
+        # A 1-tuple key orders exactly like its element, so skip the wrapper
+        sort_key = sort_vals[0]
+    else:
+        def sort_key(row: Row) -> Tuple[Any, ...]:
+            return tuple([f(row) for f in sort_vals])
+
+    if limit is not None:
+        # Only the first `limit` rows are wanted: keep a heap of that size
+        # instead of sorting everything. Same result (and tie order) as
+        # slicing the fully sorted list.
+        select_top = heapq.nlargest if descending else heapq.nsmallest
+        return select_top(limit, data, key=sort_key)
+
+    # sorted() evaluates the key function exactly once per row
+    return sorted(data, key=sort_key, reverse=descending)
 
 
 def collect(data: Relation) -> Relation:
@@ -11,8 +11,11 @@ import os
 import pathlib
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from .fastjson import loads
+
 
 def jsonl_to_json_array_string(jsonl_input_stream) -> str:
     """Read JSONL from a stream and return a JSON array string.
@@ -26,7 +29,7 @@ def jsonl_to_json_array_string(jsonl_input_stream) -> str:
     records = []
     for line in jsonl_input_stream:
         try:
-            records.append(json.loads(line))
+            records.append(loads(line))
         except json.JSONDecodeError as e:
             print(
                 f"Skipping invalid JSON line: {line.strip()} - Error: {e}",
@@ -50,7 +53,7 @@ def json_array_to_jsonl_lines(json_array_input_stream):
     """
     try:
         json_string = "".join(json_array_input_stream)
-        data = json.loads(json_string)
+        data = loads(json_string)
         if not isinstance(data, list):
             raise ValueError("Input is not a JSON array.")
         for record in data:
@@ -89,7 +92,7 @@ def jsonl_to_dir(
     count = 0
     for i, line in enumerate(jsonl_input_stream):
         try:
-            record = json.loads(line)
+            record = loads(line)
             file_path = output_dir / f"item-{i}.json"
             with open(file_path, "w") as f:
                 json.dump(record, f, indent=2)
@@ -115,38 +118,35 @@ def _ensure_unique_key(data_dict, base_key):
         counter += 1
 
 
+_ITEM_PATTERN = re.compile(r"item-(\d+)\.json$", re.IGNORECASE)
+
+
 def _sort_files_for_implode(filenames_with_paths):
     """
     Sorts files: by index if all match 'item-<index>.json', otherwise lexicographically.
     Input is a list of pathlib.Path objects.
     """
-    item_pattern = re.compile(r"item-(\d+)\.json$", re.IGNORECASE)
+    # One pass collects both the index order and the .json files needed for
+    # the lexicographical fallback
     indexed_files = []
-    other_files = []
-
+    json_files = []
     all_match_pattern = True
     for path_obj in filenames_with_paths:
-        match = item_pattern.match(path_obj.name)
+        match = _ITEM_PATTERN.match(path_obj.name)
         if match:
             indexed_files.append((int(match.group(1)), path_obj))
+            json_files.append(path_obj)
         else:
             all_match_pattern = False
-            other_files.append(
-                path_obj
-            )  # Collect for lexicographical sort if pattern fails
+            if path_obj.name.lower().endswith(".json"):
+                json_files.append(path_obj)
 
-    if (
-        indexed_files and not other_files and all_match_pattern
-    ):  # All files matched the pattern
+    if indexed_files and all_match_pattern:  # All files matched the pattern
         indexed_files.sort(key=lambda x: x[0])
         return [path_obj for _, path_obj in indexed_files]
-    else:
-        # Fallback to lexicographical sort for all .json files found
-        all_json_files = [
-            p for p in filenames_with_paths if p.name.lower().endswith(".json")
-        ]
-        all_json_files.sort()
-        return all_json_files
+    # Fallback to lexicographical sort for all .json files found
+    json_files.sort()
+    return json_files
 
 
 def dir_to_jsonl(
@@ -174,10 +174,10 @@ def dir_to_jsonl(
 
     sorted_file_paths = _sort_files_for_implode(json_files_paths)
 
-    for file_path in sorted_file_paths:
+    for file_path, data, error in _read_json_files(sorted_file_paths):
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            if error is not None:
+                raise error
 
             if add_filename_key:
                 # Use relative path from the input_dir to keep it cleaner
@@ -194,3 +194,31 @@ def dir_to_jsonl(
         except Exception as e:
             print(f"Error processing file {file_path}: {e}", file=sys.stderr)
             continue
+
+
+# Files read ahead of the consumer; bounds memory for very large directories
+_READ_BATCH_SIZE = 256
+
+
+def _read_json_file(file_path):
+    """Read and parse one JSON file, returning ``(path, data, error)``."""
+    try:
+        with open(file_path, "r") as f:
+            return file_path, loads(f.read()), None
+    except Exception as e:
+        return file_path, None, e
+
+
+def _read_json_files(file_paths):
+    """Read JSON files on a thread pool, yielding results in input order.
+
+    Reading is I/O bound, so a few threads overlap the waits; files are
+    submitted in batches so only a bounded number are held in memory.
+    """
+    if len(file_paths) <= 1:
+        yield from map(_read_json_file, file_paths)
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as pool:
+        for start in range(0, len(file_paths), _READ_BATCH_SIZE):
+            batch = file_paths[start : start + _READ_BATCH_SIZE]
+            yield from pool.map(_read_json_file, batch)
@@ -10,37 +10,73 @@ CSV format.
 """
 
 import csv
+import functools
+import itertools
 import json
 import sys
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional
+
+from .fastjson import loads
 
 
 def _flatten_dict(d, parent_key="", sep="."):
-    """Recursively flatten a nested dictionary using dot notation.
+    """Flatten a nested dictionary using dot notation.
 
     This helper function turns a nested structure like `{"user": {"id": 1}}`
-    into a flat dictionary `{"user.id": 1}`.
+    into a flat dictionary `{"user.id": 1}`. Nested levels are walked with
+    an explicit stack of item iterators, in the same depth-first order as
+    a recursive walk, writing straight into a single output dictionary.
 
     Args:
         d (dict): The dictionary to flatten.
-        parent_key (str): The prefix to use for the keys (used in recursion).
+        parent_key (str): The prefix to use for the keys.
         sep (str): The separator to use between nested keys.
 
     Returns:
         A new, flattened dictionary with dot-separated keys.
     """
-    items = []
-    for k, v in d.items():
-        new_key = parent_key + sep + k if parent_key else k
-        if isinstance(v, dict) and v:
-            items.extend(_flatten_dict(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            # Serialize lists/arrays to a JSON string as a fallback.
-            # A more advanced version could offer different strategies.
-            items.append((new_key, json.dumps(v)))
+    out = {}
+    dumps = json.dumps
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = prefix + sep + k if prefix else k
+            if isinstance(v, dict) and v:
+                # Descend; this level resumes once the nested one is done
+                stack.append((new_key, iter(v.items())))
+                break
+            elif isinstance(v, list):
+                # Serialize lists/arrays to a JSON string as a fallback.
+                # A more advanced version could offer different strategies.
+                out[new_key] = dumps(v)
+            else:
+                out[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return out
+
+
+# Input types whose results can be cached: equal values of these types are
+# interchangeable (floats are left out, since 0.0 == -0.0).
+_CACHEABLE_TYPES = (str, int, bool, type(None))
+
+
+def _cached_column_function(func, maxsize: int = 1024):
+    """Wrap a column function to reuse its result for repeated scalar inputs.
+
+    Categorical columns repeat the same few values many times, so calling
+    e.g. a parsing lambda once per distinct value saves most of the work.
+    Other inputs (floats, nested dicts and lists) are passed straight through.
+    """
+    cached = functools.lru_cache(maxsize=maxsize, typed=True)(func)
+
+    def call(value):
+        if type(value) in _CACHEABLE_TYPES:
+            return cached(value)
+        return func(value)
+
+    return call
 
 
 def jsonl_to_csv_stream(
@@ -49,6 +85,7 @@ def jsonl_to_csv_stream(
     flatten: bool = True,
     flatten_sep: str = ".",
     column_functions: Optional[dict] = None,
+    fieldnames: Optional[List[str]] = None,
 ):
     """Convert a stream of JSONL data into a CSV stream.
 
@@ -60,6 +97,12 @@ def jsonl_to_csv_stream(
     structures like `{"user": {"name": "X"}}` into a `user.name` column.
     You can also provide custom functions to transform data on the fly.
 
+    Records are not held in memory when it can be avoided: with explicit
+    `fieldnames` the input is converted in a single streaming pass, and a
+    seekable input (such as a file) is read twice, once to discover the
+    headers and once to write the rows. Only non-seekable input without
+    `fieldnames` (such as a pipe) is buffered.
+
     Args:
         jsonl_stream: An input stream (like a file handle) yielding JSONL strings.
         output_stream: An output stream (like `sys.stdout` or a file handle)
@@ -71,52 +114,89 @@ def jsonl_to_csv_stream(
         column_functions (dict): A dictionary mapping column names to functions
                                  that will be applied to that column's data
                                  before writing to CSV. For example,
-                                 `{"price": float}`.
+                                 `{"price": float}`. Functions should be
+                                 pure: results are reused for repeated
+                                 string, integer, boolean and null inputs.
+        fieldnames (list): The CSV columns, in order. Skips header discovery;
+                           columns not listed are left out.
     """
     if column_functions is None:
         column_functions = {}
+    column_functions = {
+        col: _cached_column_function(func) for col, func in column_functions.items()
+    }
+    dumps = json.dumps
 
-    # First pass: Discover all possible headers from the entire stream
-    records = [json.loads(line) for line in jsonl_stream if line.strip()]
-    if not records:
-        return
+    def process(line: str, report_errors: bool = True) -> dict:
+        rec = loads(line)
 
-    # Apply column functions before flattening
-    for rec in records:
+        # Apply column functions before flattening
         for col, func in column_functions.items():
             if col in rec:
                 try:
                     rec[col] = func(rec[col])
                 except Exception as e:
                     # Optionally, log this error or handle it as needed
-                    print(
-                        f"Error applying function to column '{col}' for a record: {e}",
-                        file=sys.stderr,
-                    )
-
-    if flatten:
-        processed_records = [(_flatten_dict(rec, sep=flatten_sep)) for rec in records]
-    else:
-        processed_records = []
-        for rec in records:
-            processed_rec = {}
-            for k, v in rec.items():
-                if isinstance(v, (dict, list)):
-                    processed_rec[k] = json.dumps(v)
-                else:
-                    processed_rec[k] = v
-            processed_records.append(processed_rec)
-
-    # Discover all unique keys to form the CSV header
+                    if report_errors:
+                        print(
+                            f"Error applying function to column '{col}' "
+                            f"for a record: {e}",
+                            file=sys.stderr,
+                        )
+
+        if flatten:
+            return _flatten_dict(rec, sep=flatten_sep)
+        return {
+            k: dumps(v) if isinstance(v, (dict, list)) else v for k, v in rec.items()
+        }
+
+    def records(report_errors: bool = True) -> Iterator[dict]:
+        for line in jsonl_stream:
+            if line.strip():
+                yield process(line, report_errors)
+
+    def write(headers: List[str], rows: Iterable[dict]) -> None:
+        # Plain csv.writer over values in header order; missing keys come out
+        # as None, which csv writes as an empty field like DictWriter's restval.
+        writer = csv.writer(output_stream, lineterminator="\n")
+        writer.writerow(headers)
+        writer.writerows(map(rec.get, headers) for rec in rows)
+
+    if fieldnames is not None:
+        rows = records()
+        first = next(rows, None)
+        if first is not None:
+            write(list(fieldnames), itertools.chain([first], rows))
+        return
+
+    seekable = getattr(jsonl_stream, "seekable", None)
+    if seekable is not None and seekable():
+        # First pass: discover all possible headers from the entire stream.
+        # Errors from column functions are reported once, on the second pass.
+        start = jsonl_stream.tell()
+        rows = records(report_errors=False)
+        first = next(rows, None)
+        if first is None:
+            return
+        headers = _discover_headers(itertools.chain([first], rows))
+        # Second pass: re-read the input and write it row by row
+        jsonl_stream.seek(start)
+        write(headers, records())
+        return
+
+    processed_records = list(records())
+    if not processed_records:
+        return
+    write(_discover_headers(processed_records), processed_records)
+
+
+def _discover_headers(rows: Iterable[dict]) -> List[str]:
+    """Collect the keys of all rows, in order of first appearance."""
     headers = []
     header_set = set()
-    for rec in processed_records:
+    for rec in rows:
         for key in rec.keys():
             if key not in header_set:
                 header_set.add(key)
                 headers.append(key)
-
-    # Second pass: Write to the output stream
-    writer = csv.DictWriter(output_stream, fieldnames=headers, lineterminator="\n")
-    writer.writeheader()
-    writer.writerows(processed_records)
+    return headers
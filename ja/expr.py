@@ -4,25 +4,64 @@ This module provides a lightweight expression parser that allows intuitive
 syntax without quotes for most common cases.
 """
 
+import functools
 import operator
-import re
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_field_path(field_path: str) -> Tuple[str, ...]:
+    """Tokenize a field path ("a.b[0]" -> ("a", "b", "0")), cached."""
+    parts = field_path.replace("[", ".").replace("]", ".").split(".")
+    return tuple(p for p in parts if p)
+
+
+# Per-instance limit on cached compiled expressions
+_CACHE_SIZE = 1024
+
+# Arithmetic operators, in the order evaluate_arithmetic tries them
+_ARITHMETIC_OPERATORS = [
+    ("*", operator.mul),
+    ("+", operator.add),
+    ("-", operator.sub),
+    ("/", operator.truediv),
+]
+
+# Types whose comparisons fail (or not) by type alone, never by value
+_SCALAR_TYPES = frozenset([str, int, float, bool])
+
+# Compiled ``and``/``or`` chains are folded into nested closures, which
+# short-circuit without running a generator through all()/any() per row.
+
+
+def _both(first, second):
+    return lambda context: first(context) and second(context)
+
+
+def _either(first, second):
+    return lambda context: first(context) or second(context)
 
 
 class ExprEval:
     """Parse and evaluate expressions for filtering, comparison, and arithmetic."""
 
+    # Operators in precedence order (longest first to handle >= before >)
+    operators = (
+        ("==", operator.eq),
+        ("!=", operator.ne),
+        (">=", operator.ge),
+        ("<=", operator.le),
+        (">", operator.gt),
+        ("<", operator.lt),
+    )
+    _operator_map = dict(operators)
+
     def __init__(self):
-        # Operators in precedence order (longest first to handle >= before >)
-        self.operators = [
-            ("==", operator.eq),
-            ("!=", operator.ne),
-            (">=", operator.ge),
-            ("<=", operator.le),
-            (">", operator.gt),
-            ("<", operator.lt),
-        ]
-        self._operator_map = dict(self.operators)
+        # Compiled forms of the expressions passed to evaluate() and
+        # evaluate_arithmetic(), which are usually called once per row
+        # with the same expression
+        self._conditions: Dict[str, Callable[[Dict[str, Any]], bool]] = {}
+        self._arithmetic: Dict[str, Callable[[Dict[str, Any]], Optional[float]]] = {}
 
     def parse_value(self, value_str: str) -> Any:
         """Parse a value string into appropriate Python type.
@@ -41,29 +80,32 @@ class ExprEval:
         if not value_str:
             return ""
 
-        # Boolean literals (case-insensitive)
-        if value_str.lower() == "true":
-            return True
-        if value_str.lower() == "false":
-            return False
-
-        # Null literal
-        if value_str.lower() in ("null", "none"):
-            return None
+        # Dispatch on the first character so most values need one test
+        first = value_str[0]
 
         # Numbers
-        try:
-            if "." in value_str:
-                return float(value_str)
-            return int(value_str)
-        except ValueError:
-            pass
+        if first.isdigit() or first in "+-.":
+            try:
+                if "." in value_str:
+                    return float(value_str)
+                return int(value_str)
+            except ValueError:
+                pass
 
         # Quoted strings (remove quotes)
-        if (value_str.startswith('"') and value_str.endswith('"')) or (
-            value_str.startswith("'") and value_str.endswith("'")
-        ):
-            return value_str[1:-1]
+        elif first in "\"'":
+            if value_str[-1] == first:
+                return value_str[1:-1]
+
+        # Boolean and null literals (case-insensitive)
+        elif len(value_str) <= 5:
+            lowered = value_str.lower()
+            if lowered == "true":
+                return True
+            if lowered == "false":
+                return False
+            if lowered in ("null", "none"):
+                return None
 
         # Unquoted strings (the nice default!)
         return value_str
@@ -78,13 +120,19 @@ class ExprEval:
         if not field_path:
             return obj
 
+        # Flat keys, the common case, need no tokenizing
+        if (
+            isinstance(obj, dict)
+            and "." not in field_path
+            and "[" not in field_path
+            and "]" not in field_path
+        ):
+            return obj.get(field_path)
+
         current: Any = obj
 
         # Handle array indexing and dots
-        parts = re.split(r"\.|\[|\]", field_path)
-        parts = [p for p in parts if p]  # Remove empty strings
-
-        for part in parts:
+        for part in _split_field_path(field_path):
             if current is None:
                 return None
 
@@ -103,6 +151,54 @@ class ExprEval:
 
         return current
 
+    def compile_path(self, field_path: str) -> Callable[[Any], Any]:
+        """Compile a field path into a function returning its value.
+
+        The path is tokenized once here rather than on every call; the
+        returned function behaves exactly like :meth:`get_field_value`.
+
+        Examples:
+            compile_path("user.name")({"user": {"name": "Alice"}}) -> "Alice"
+        """
+        if not field_path:
+            return lambda obj: obj
+
+        parts = _split_field_path(field_path)
+        get_field_value = self.get_field_value
+
+        if len(parts) == 1:
+            part = parts[0]
+
+            def get_top_level(obj: Any) -> Any:
+                if type(obj) is dict:
+                    return obj.get(part)
+                return get_field_value(obj, field_path)
+
+            return get_top_level
+
+        # Each step is (dict key, list index or None if not an integer)
+        steps = []
+        for part in parts:
+            try:
+                steps.append((part, int(part)))
+            except ValueError:
+                steps.append((part, None))
+
+        def get_nested(obj: Any) -> Any:
+            current = obj
+            for part, idx in steps:
+                if isinstance(current, dict):
+                    current = current.get(part)
+                elif isinstance(current, list):
+                    if idx is None:
+                        return None
+                    current = current[idx] if 0 <= idx < len(current) else None
+                else:
+                    return None
+            return current
+
+        return get_nested
+
     def set_field_value(self, obj: Dict[str, Any], field_path: str, value: Any) -> None:
         """Set value in nested object using dot notation."""
         if not field_path:
@@ -154,39 +250,105 @@ class ExprEval:
             "age > 30"
             "user.type == premium"
         """
+        condition = self._conditions.get(expr)
+        if condition is None:
+            if len(self._conditions) >= _CACHE_SIZE:
+                self._conditions.clear()
+            condition = self._conditions[expr] = self._compile_condition(expr)
+        return condition(context)
+
+    def compile(self, expr: str) -> Callable[[Dict[str, Any]], bool]:
+        """Compile a filter expression into a predicate.
+
+        The expression may join conditions with ``and`` or ``or`` (not both,
+        ``and`` wins). Splitting and operator lookup happen once here, so
+        the returned function only does the per-row work of
+        :meth:`evaluate`, with the same results.
+
+        Examples:
+            compile("age > 30")({"age": 42}) -> True
+            compile("status == active and age > 30")
+        """
+        if " and " in expr:
+            conditions = [self._compile_condition(c) for c in expr.split(" and ")]
+            return functools.reduce(_both, conditions)
+        if " or " in expr:
+            conditions = [self._compile_condition(c) for c in expr.split(" or ")]
+            return functools.reduce(_either, conditions)
+        return self._compile_condition(expr)
+
+    def _compile_condition(self, expr: str) -> Callable[[Dict[str, Any]], bool]:
+        """Compile a single condition, see :meth:`evaluate`."""
         expr = expr.strip()
+        compile_path = self.compile_path
 
         # Empty expression is false
         if not expr:
-            return False
+            return lambda context: False
 
-        # Check for operators
-        for op_str, op_func in self.operators:
+        for op_str, _ in self.operators:
             if op_str in expr:
-                # Split on the FIRST occurrence of the operator
-                parts = expr.split(op_str, 1)
-                if len(parts) == 2:
-                    left_expr = parts[0].strip()
-                    right_expr = parts[1].strip()
-
-                    # Left side is always a field path
-                    left_val = self.get_field_value(context, left_expr)
-
-                    # Right side: check if it's a field or a literal
-                    # A token is a field if it exists as a key in the context
-                    # and is not a boolean/null keyword.
-                    if right_expr in context and right_expr.lower() not in ['true', 'false', 'null', 'none']:
-                        # It's a field reference
-                        right_val = self.get_field_value(context, right_expr)
+                left_str, right_str = expr.split(op_str, 1)
+                left_expr = left_str.strip()
+                right_expr = right_str.strip()
+                right_literal = self.parse_value(right_expr)
+                # Keywords are always literals; anything else is a field
+                # reference whenever the row has a key of that name
+                right_may_be_field = right_expr.lower() not in [
+                    "true", "false", "null", "none"
+                ]
+                op_func = self._operator_map[op_str]
+                # Nulls only compare under == and != (see evaluate_comparison)
+                null_op = op_func if op_str in ("==", "!=") else None
+                get_left = compile_path(left_expr)
+                get_right = compile_path(right_expr)
+                # A flat left-hand key is read inline from dict rows,
+                # saving a call per row
+                left_parts = _split_field_path(left_expr)
+                left_key = left_parts[0] if len(left_parts) == 1 else None
+                # (left type, right type) pairs of scalars that op_func
+                # rejects, which go straight to the string comparison
+                # instead of raising on every row
+                mismatched = set()
+
+                def condition(context: Dict[str, Any]) -> bool:
+                    if left_key is not None and type(context) is dict:
+                        left_val = context.get(left_key)
+                    else:
+                        left_val = get_left(context)
+                    if right_may_be_field and right_expr in context:
+                        right_val = get_right(context)
                     else:
-                        # It's a literal value
-                        right_val = self.parse_value(right_expr)
+                        right_val = right_literal
+                    # Same rules as evaluate_comparison, inlined
+                    if left_val is None or right_val is None:
+                        if null_op is None:
+                            return False
+                        return bool(null_op(left_val, right_val))
+                    if not mismatched or (
+                        (type(left_val), type(right_val)) not in mismatched
+                    ):
+                        try:
+                            return bool(op_func(left_val, right_val))
+                        except (TypeError, ValueError):
+                            left_type = type(left_val)
+                            right_type = type(right_val)
+                            if (
+                                left_type in _SCALAR_TYPES
+                                and right_type in _SCALAR_TYPES
+                            ):
+                                mismatched.add((left_type, right_type))
+                    # If comparison fails, try string comparison
+                    try:
+                        return bool(op_func(str(left_val), str(right_val)))
+                    except Exception:
+                        return False
 
-                    return self.evaluate_comparison(left_val, op_str, right_val)
+                return condition
 
         # No operator found - treat as existence/truthiness check
-        value = self.get_field_value(context, expr)
-        return bool(value)
+        get_value = compile_path(expr)
+        return lambda context: bool(get_value(context))
 
     def evaluate_arithmetic(
         self, expr: str, context: Dict[str, Any]
@@ -197,40 +359,84 @@ class ExprEval:
             "amount * 1.1"
             "score + bonus"
         """
+        return self.compile_arithmetic(expr)(context)
+
+    def compile_arithmetic(
+        self, expr: str
+    ) -> Callable[[Dict[str, Any]], Optional[float]]:
+        """Compile an arithmetic expression into a function of a row.
+
+        The returned function gives the same results as
+        :meth:`evaluate_arithmetic`, without looking the expression up on
+        every call.
+
+        Examples:
+            compile_arithmetic("amount * 1.1")({"amount": 10}) -> 11.0
+        """
+        arithmetic = self._arithmetic.get(expr)
+        if arithmetic is None:
+            if len(self._arithmetic) >= _CACHE_SIZE:
+                self._arithmetic.clear()
+            arithmetic = self._arithmetic[expr] = self._compile_arithmetic(expr)
+        return arithmetic
+
+    def _compile_arithmetic(
+        self, expr: str
+    ) -> Callable[[Dict[str, Any]], Optional[float]]:
+        """Compile an arithmetic expression, see :meth:`evaluate_arithmetic`.
+
+        Operand paths are compiled, and the literal each falls back to is
+        parsed, once here rather than per row.
+        """
+        compile_path = self.compile_path
+
         # Simple arithmetic support
-        for op, func in [
-            ("*", operator.mul),
-            ("+", operator.add),
-            ("-", operator.sub),
-            ("/", operator.truediv),
-        ]:
+        for op, func in _ARITHMETIC_OPERATORS:
             if op in expr:
-                parts = expr.split(op, 1)
-                if len(parts) == 2:
-                    left_str = parts[0].strip()
-                    right_str = parts[1].strip()
-
+                left_str, right_str = expr.split(op, 1)
+                left_str = left_str.strip()
+                right_str = right_str.strip()
+                get_left = compile_path(left_str)
+                get_right = compile_path(right_str)
+                left_literal = self.parse_value(left_str)
+                right_literal = self.parse_value(right_str)
+
+                def arithmetic(context: Dict[str, Any]) -> Optional[float]:
                     # Get left value (field or literal)
-                    left_val = self.get_field_value(context, left_str)
+                    left_val = get_left(context)
                     if left_val is None:
-                        left_val = self.parse_value(left_str)
+                        left_val = left_literal
 
                     # Get right value (field or literal)
-                    right_val = self.get_field_value(context, right_str)
+                    right_val = get_right(context)
                     if right_val is None:
-                        right_val = self.parse_value(right_str)
+                        right_val = right_literal
 
                     try:
                         return float(func(float(left_val), float(right_val)))
                     except (TypeError, ValueError):
                         return None
 
+                return arithmetic
+
         # No operator - try as field or literal
-        val = self.get_field_value(context, expr)
-        if val is None:
-            val = self.parse_value(expr)
+        get_value = compile_path(expr)
+        literal = self.parse_value(expr)
+        # A flat key is read inline from dict rows, saving a call per row
+        parts = _split_field_path(expr)
+        key = parts[0] if len(parts) == 1 else None
+
+        def value(context: Dict[str, Any]) -> Optional[float]:
+            if key is not None and type(context) is dict:
+                val = context.get(key)
+            else:
+                val = get_value(context)
+            if val is None:
+                val = literal
 
-        try:
-            return float(val)
-        except (TypeError, ValueError):
-            return None
+            try:
+                return float(val)
+            except (TypeError, ValueError):
+                return None
+
+        return value
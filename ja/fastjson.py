@@ -0,0 +1,38 @@
+"""JSON decoding with an optional fast path.
+
+Decoding JSONL lines is the main cost of most commands. When ``orjson`` is
+installed (see the "fast" extra) it is used to parse each document; anything
+it rejects is handed to the standard library, so results and errors are the
+same with or without it (e.g. ``NaN`` literals still parse and invalid input
+raises ``json.JSONDecodeError``). Documents with very long digit runs also
+go to the standard library, since orjson reads integers wider than 64 bits
+as floats.
+
+Encoding is left to the standard library, whose output format (``", "`` and
+``": "`` separators) is what ``ja`` writes.
+"""
+
+import json
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# Any number this long might not fit in 64 bits
+_LONG_NUMBER = re.compile(r"\d{19}")
+_LONG_NUMBER_BYTES = re.compile(rb"\d{19}")
+
+
+def loads(document: Union[str, bytes]) -> Any:
+    """Parse a JSON document, like :func:`json.loads`."""
+    if orjson is not None:
+        long_number = _LONG_NUMBER if isinstance(document, str) else _LONG_NUMBER_BYTES
+        if not long_number.search(document):
+            try:
+                return orjson.loads(document)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(document)
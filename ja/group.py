@@ -5,9 +5,9 @@ aggregation and metadata-based chaining for multi-level grouping.
 """
 
 from collections import defaultdict
-from typing import Dict, List, Any, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Any, Tuple, Union
 
-from .agg import parse_agg_specs, apply_single_agg
+from .agg import parse_agg_specs, aggregate_by_key
 from .expr import ExprEval
 import json
 
@@ -15,6 +15,9 @@ import json
 Row = Dict[str, Any]
 Relation = List[Row]
 
+# Shared evaluator, so its caches outlive a single call
+_EXPR = ExprEval()
+
 
 def groupby_with_metadata(data: Relation, group_key: str) -> Relation:
     """Group data and add metadata fields.
@@ -32,16 +35,19 @@ def groupby_with_metadata(data: Relation, group_key: str) -> Relation:
     Returns:
         List with group metadata added to each row
     """
-    parser = ExprEval()
+    get_key = _EXPR.compile_path(group_key)
 
     # First pass: collect groups
     groups = defaultdict(list)
+    serialized_keys = set()
     for row in data:
+        key_value = get_key(row)
         try:
-            key_value = parser.get_field_value(row, group_key)
             groups[key_value].append(row)
-        except Exception:
+        except TypeError:
+            # Unhashable values (dicts, lists) group by their JSON form
             key_value = json.dumps(key_value, ensure_ascii=False, sort_keys=True)
+            serialized_keys.add(key_value)
             groups[key_value].append(row)
 
     # Second pass: add metadata and flatten
@@ -49,16 +55,17 @@ def groupby_with_metadata(data: Relation, group_key: str) -> Relation:
 
     for i, (group_value, group_rows) in enumerate(groups.items()):
         group_size = len(group_rows)
+        # Decode the keys serialized above, leaving string values as they are
+        if group_value in serialized_keys:
+            group_value = json.loads(group_value)
+        # The _groups list is shared by the group's rows, as chained groupby
+        # shares the entries of earlier levels; nothing updates it in place
+        group_list = [{"field": group_key, "value": group_value}]
         for index, row in enumerate(group_rows):
-            # Create new row with metadata
+            # Create new row with metadata; copy() and three stores beat a
+            # {**row, ...} display, which re-inserts every key
             new_row = row.copy()
-            # Check if group_value is a serialized json value
-            if isinstance(group_value, str):
-                try:
-                    group_value = json.loads(group_value)
-                except json.JSONDecodeError:
-                    pass
-            new_row["_groups"] = [{"field": group_key, "value": group_value}]
+            new_row["_groups"] = group_list
             new_row["_group_size"] = group_size
             new_row["_group_index"] = index
             result.append(new_row)
@@ -79,7 +86,7 @@ def groupby_chained(grouped_data: Relation, new_group_key: str) -> Relation:
     Returns:
         List with nested group metadata
     """
-    parser = ExprEval()
+    get_key = _EXPR.compile_path(new_group_key)
 
     # Group within existing groups
     nested_groups = defaultdict(list)
@@ -87,31 +94,34 @@ def groupby_chained(grouped_data: Relation, new_group_key: str) -> Relation:
     for row in grouped_data:
         # Get existing groups
         existing_groups = row.get("_groups", [])
-        new_key_value = parser.get_field_value(row, new_group_key)
+        new_key_value = get_key(row)
 
         # Create a tuple key for grouping (for internal use only)
-        group_tuple = tuple((g["field"], g["value"]) for g in existing_groups)
-        group_tuple += ((new_group_key, new_key_value),)
-
+        group_tuple = (
+            *[(g["field"], g["value"]) for g in existing_groups],
+            (new_group_key, new_key_value),
+        )
+
+        # Each row keeps its own key value: equal keys such as 1 and True
+        # share a group but are reported as they appear in the row
+        entry = (row, existing_groups, new_key_value)
         try:
-            nested_groups[group_tuple].append(row)
-        except Exception:
+            nested_groups[group_tuple].append(entry)
+        except TypeError:
             # Make group_tuple hashable
             hashable_key = tuple(str(item) for item in group_tuple)
-            nested_groups[hashable_key].append(row)  # type: ignore[index]
-            nested_groups[group_tuple].append(row)
+            nested_groups[hashable_key].append(entry)  # type: ignore[index]
 
-    # Add new metadata
+    # Add new metadata, reusing what the grouping pass read from each row
     result = []
-    for group_tuple, group_rows in nested_groups.items():
-        group_size = len(group_rows)
+    for group_tuple, group_entries in nested_groups.items():
+        group_size = len(group_entries)
 
-        for index, row in enumerate(group_rows):
+        for index, (row, existing_groups, value) in enumerate(group_entries):
             new_row = row.copy()
-            value = parser.get_field_value(row, new_group_key)
 
             # Extend the groups list
-            new_row["_groups"] = row.get("_groups", []).copy()
+            new_row["_groups"] = existing_groups.copy()
             new_row["_groups"].append({
                 "field": new_group_key,
                 "value": value
@@ -124,30 +134,37 @@ def groupby_chained(grouped_data: Relation, new_group_key: str) -> Relation:
     return result
 
 
-def groupby_agg(data: Relation, group_key: str, agg_spec: Union[str, List[Tuple[str, str]]]) -> Relation:
+def groupby_agg(
+    data: Iterable[Row], group_key: str, agg_spec: Union[str, List[Tuple[str, str]]]
+) -> Relation:
     """Group and aggregate in one operation.
     
     This function is kept for backward compatibility and for the --agg flag.
     It's more efficient for simple cases but less flexible than chaining.
+    The rows may be any iterable, e.g. a stream read from a JSONL file; it
+    is consumed once and only the per-group results are kept in memory.
     
     Args:
-        data: List of dictionaries to group and aggregate
+        data: List or other iterable of dictionaries to group and aggregate
         group_key: Field to group by
         agg_spec: Aggregation specification
         
     Returns:
         List of aggregated results, one per group
     """
-    parser = ExprEval()
-    
-    # Group data
-    groups = defaultdict(list)
-    for row in data:
-        key = parser.get_field_value(row, group_key)
-        groups[key].append(row)
-    
-    # Apply aggregations
-    result = []
+    return list(igroupby_agg(data, group_key, agg_spec))
+
+
+def igroupby_agg(
+    data: Iterable[Row], group_key: str, agg_spec: Union[str, List[Tuple[str, str]]]
+) -> Iterator[Row]:
+    """Yield the aggregated row of each group, see :func:`groupby_agg`.
+
+    Every input row is read before the first result, but each result row
+    is only built when it is asked for, so results can be written out
+    without holding them all at once.
+    """
+    get_key = _EXPR.compile_path(group_key)
 
     # Handle both string and list inputs for backward compatibility
     if isinstance(agg_spec, str):
@@ -165,10 +182,8 @@ def groupby_agg(data: Relation, group_key: str, agg_spec: Union[str, List[Tuple[
                 raise ValueError(f"Unknown aggregation function: '{name}'. "
                                f"Supported functions: {', '.join(sorted(supported_funcs))}")
     
-    for key, group_rows in groups.items():
+    # Group and aggregate in a single pass over the rows
+    for key, aggs in aggregate_by_key(data, get_key, agg_specs):
         row_result = {group_key: key}
-        for spec in agg_specs:
-            row_result.update(apply_single_agg(spec, group_rows))
-        result.append(row_result)
-    
-    return result
\ No newline at end of file
+        row_result.update(aggs)
+        yield row_result
\ No newline at end of file
@@ -50,8 +50,9 @@ def _partition_data(
         else:
             keys = partition_by
 
+        getters = [parser.compile_path(k) for k in keys]
         for i, row in enumerate(data):
-            partition_key = tuple(parser.get_field_value(row, k) for k in keys)
+            partition_key = tuple([get(row) for get in getters])
             partitions[partition_key].append((i, row))
 
     return partitions
@@ -82,11 +83,13 @@ def _sort_partition(
     else:
         keys = order_by
 
+    getters = [parser.compile_path(k) for k in keys]
+
     def sort_key(item):
         _, row = item
         values = []
-        for k in keys:
-            val = parser.get_field_value(row, k)
+        for get in getters:
+            val = get(row)
             # Handle None values (sort first)
             if val is None:
                 values.append((True, ""))
@@ -163,8 +166,10 @@ def rank(
     else:
         order_keys = order_by
 
+    order_getters = [parser.compile_path(k) for k in order_keys]
+
     def get_order_value(row):
-        return tuple(parser.get_field_value(row, k) for k in order_keys)
+        return tuple([get(row) for get in order_getters])
 
     for partition in partitions.values():
         sorted_partition = _sort_partition(partition, order_by)
@@ -216,8 +221,10 @@ def dense_rank(
     else:
         order_keys = order_by
 
+    order_getters = [parser.compile_path(k) for k in order_keys]
+
     def get_order_value(row):
-        return tuple(parser.get_field_value(row, k) for k in order_keys)
+        return tuple([get(row) for get in order_getters])
 
     for partition in partitions.values():
         sorted_partition = _sort_partition(partition, order_by)
@@ -266,6 +273,7 @@ def lag(
 
     if output_field is None:
         output_field = f"_lag_{field.replace('.', '_')}"
+    get_field = parser.compile_path(field)
 
     for partition in partitions.values():
         sorted_partition = _sort_partition(partition, order_by)
@@ -273,7 +281,7 @@ def lag(
         for i, (orig_idx, _) in enumerate(sorted_partition):
             if i >= offset:
                 prev_idx, prev_row = sorted_partition[i - offset]
-                value = parser.get_field_value(prev_row, field)
+                value = get_field(prev_row)
                 result[orig_idx][output_field] = value if value is not None else default
             else:
                 result[orig_idx][output_field] = default
@@ -310,6 +318,7 @@ def lead(
 
     if output_field is None:
         output_field = f"_lead_{field.replace('.', '_')}"
+    get_field = parser.compile_path(field)
 
     for partition in partitions.values():
         sorted_partition = _sort_partition(partition, order_by)
@@ -318,7 +327,7 @@ def lead(
         for i, (orig_idx, _) in enumerate(sorted_partition):
             if i + offset < n:
                 next_idx, next_row = sorted_partition[i + offset]
-                value = parser.get_field_value(next_row, field)
+                value = get_field(next_row)
                 result[orig_idx][output_field] = value if value is not None else default
             else:
                 result[orig_idx][output_field] = default
@@ -514,8 +523,10 @@ def cume_dist(
     else:
         order_keys = order_by
 
+    order_getters = [parser.compile_path(k) for k in order_keys]
+
     def get_order_value(row):
-        return tuple(parser.get_field_value(row, k) for k in order_keys)
+        return tuple([get(row) for get in order_getters])
 
     for partition in partitions.values():
         sorted_partition = _sort_partition(partition, order_by)
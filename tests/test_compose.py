@@ -19,7 +19,7 @@ from ja.compose import (
     Take, Skip, Map, Filter, Batch,
     compose, pipe
 )
-from ja.core import select, project, distinct
+from ja.core import select, project, distinct, sort_by
 
 
 class TestPipeline:
@@ -113,6 +113,19 @@ class TestPipeline:
         assert len(items) == 2
         assert all(r["age"] > 25 for r in items)
 
+    def test_lazy_pipeline_streams_list_input(self, sample_data):
+        """Given a lazy pipeline over a list, then rows after Take are not read."""
+        seen = []
+        p = lazy_pipeline(
+            Map(lambda r: seen.append(r) or r),
+            Select("age > 25"),
+            Take(1)
+        )
+        result = list(p(sample_data))
+
+        assert len(result) == 1
+        assert len(seen) < len(sample_data)
+
     def test_pipeline_callable_convenience_function(self, sample_data):
         """Given pipeline() convenience function, when used, then creates working pipeline."""
         p = pipeline(
@@ -196,6 +209,13 @@ class TestSelectOperation:
         assert not isinstance(result, list)
         assert len(list(result)) == 2
 
+    def test_select_jmespath_with_lazy_iterator(self, sample_data):
+        """Given a JMESPath Select over an iterator, then it agrees with eager mode."""
+        op = Select("score >= `85`", use_jmespath=True)
+
+        assert list(op(iter(sample_data))) == op(sample_data)
+        assert len(op(sample_data)) == 2
+
     def test_select_can_be_piped_with_other_operations(self, sample_data):
         """Given Select piped with Project, when applied, then both operations work."""
         pipeline = Select("score >= 85") | Project(["name"])
@@ -302,6 +322,18 @@ class TestSortOperation:
 
         assert isinstance(result, list)
 
+    def test_sort_with_limit(self, sample_data):
+        """Given Sort with a limit, then the first rows of the full sort come back."""
+        expected = Sort(["age", "name"])(sample_data)[:2]
+        assert Sort(["age", "name"], limit=2)(sample_data) == expected
+        top = Sort("score", descending=True, limit=1)
+        assert top(sample_data) == [sample_data[1]]
+
+    def test_sort_then_take_in_pipeline(self, sample_data):
+        """Given Sort followed by Take, then results match sorting everything first."""
+        p = Pipeline(Sort("age", descending=True), Take(2))
+        assert p(sample_data) == sort_by(sample_data, "age", descending=True)[:2]
+
     def test_sort_with_empty_input(self):
         """Given Sort with empty input, when applied, then returns empty list."""
         op = Sort("name")
@@ -1,16 +1,25 @@
 import unittest
+from unittest.mock import patch
 
+import ja.core
 from ja.core import (
     Relation,
     _row_to_hashable_key,
     difference,
     distinct,
+    idifference,
+    idistinct,
+    iintersection,
+    ijoin,
     intersection,
+    iproduct,
+    iunion,
     join,
     product,
     project,
     rename,
     select,
+    select_compiled,
     sort_by,
     union,
 )
@@ -45,6 +54,17 @@ class TestCoreFunctions(unittest.TestCase):
         selected_empty = select([], "age == `30`")
         self.assertEqual(len(selected_empty), 0)
 
+    def test_select_compiled(self):
+        import jmespath
+
+        data: Relation = [
+            {"id": 1, "name": "Alice", "age": 30},
+            {"id": 2, "name": "Bob", "age": 24},
+        ]
+        compiled = jmespath.compile("age > `25`")
+        self.assertEqual(select_compiled(data, compiled), [data[0]])
+        self.assertEqual(select_compiled([], compiled), [])
+
     def test_project_1(self):
         data: Relation = [
             {"id": 1, "name": "Alice", "age": 30, "city": "New York"},
@@ -155,6 +175,33 @@ class TestCoreFunctions(unittest.TestCase):
         for res in expected_results:
             self.assertIn(res, joined_data)
 
+    def test_join_unique_right_keys(self):
+        left: Relation = [
+            {"id": 1, "name": "Alice"},
+            {"id": 2, "name": "Bob"},
+            {"id": 1, "name": "Alicia"},
+        ]
+        right: Relation = [
+            {"user_id": 1, "city": "NYC"},
+            {"user_id": 2, "city": "London"},
+        ]
+
+        joined_data = join(left, right, [("id", "user_id")])
+        self.assertEqual(
+            joined_data,
+            [
+                {"id": 1, "name": "Alice", "city": "NYC"},
+                {"id": 2, "name": "Bob", "city": "London"},
+                {"id": 1, "name": "Alicia", "city": "NYC"},
+            ],
+        )
+
+        # A duplicate key appearing late still yields every match
+        right_dup = right + [{"user_id": 2, "city": "Paris"}]
+        joined_dup = join(left, right_dup, [("id", "user_id")])
+        self.assertEqual(len(joined_dup), 4)
+        self.assertIn({"id": 2, "name": "Bob", "city": "Paris"}, joined_dup)
+
     def test_join_no_matches(self):
         left: Relation = [
             {"id": 1, "name": "Alice"},
@@ -392,6 +439,87 @@ class TestCoreFunctions(unittest.TestCase):
         expected_ordered_distinct: Relation = [{"a": 1}, {"b": 2}, {"c": 3}]
         self.assertEqual(distinct(ordered_data), expected_ordered_distinct)
 
+    def test_distinct_presorted(self):
+        data: Relation = [
+            {"id": 1, "tags": ["a"]},
+            {"tags": ["a"], "id": 1},
+            {"id": 2, "tags": []},
+            {"id": 2, "tags": []},
+            {"id": 3, "tags": []},
+        ]
+        self.assertEqual(distinct(data, presorted=True), distinct(data))
+        self.assertEqual(list(idistinct(iter(data), presorted=True)), distinct(data))
+        self.assertEqual(distinct([], presorted=True), [])
+
+    def test_set_operations_nested_values(self):
+        data: Relation = [
+            {"id": 1, "tags": ["a", "b"], "meta": {"x": 1, "y": 2}},
+            {"meta": {"y": 2, "x": 1}, "tags": ["a", "b"], "id": 1},
+            {"id": 2, "tags": ["c"], "meta": {}},
+        ]
+        self.assertEqual(distinct(data), [data[0], data[2]])
+        self.assertEqual(intersection(data, [data[2]]), [data[2]])
+        self.assertEqual(difference(data, [data[1]]), [data[2]])
+
+    def test_set_operations_non_finite_vs_null(self):
+        for value in (float("nan"), float("inf"), float("-inf")):
+            for encoder in (ja.core.orjson, None):
+                with self.subTest(value=value, orjson=encoder is not None), patch(
+                    "ja.core.orjson", encoder
+                ):
+                    rows: Relation = [{"a": value}, {"a": None}]
+                    self.assertEqual(len(distinct(rows)), 2)
+                    self.assertEqual(intersection([rows[0]], [rows[1]]), [])
+                    self.assertEqual(difference([rows[0]], [rows[1]]), [rows[0]])
+
+    def test_set_operations_value_equality(self):
+        # Rows compare by their JSON form, not by Python equality
+        pairs = [(1, 1.0), (True, 1), (False, 0), (0.0, -0.0)]
+        for encoder in (ja.core.orjson, None):
+            for left, right in pairs:
+                rows: Relation = [{"a": left}, {"a": right}]
+                with self.subTest(left=left, right=right, orjson=encoder is not None):
+                    with patch("ja.core.orjson", encoder):
+                        self.assertEqual(distinct(rows), rows)
+                        self.assertEqual(intersection([rows[0]], [rows[1]]), [])
+                        self.assertEqual(difference([rows[0]], [rows[1]]), [rows[0]])
+
+            # Any two NaNs are the same value
+            with patch("ja.core.orjson", encoder):
+                nans: Relation = [{"a": float("nan")}, {"a": float("nan")}]
+                self.assertEqual(len(distinct(nans)), 1)
+
+    def test_streaming_variants(self):
+        left: Relation = [{"id": 1}, {"id": 2}, {"id": 1}]
+        right: Relation = [{"id": 1, "v": "x"}, {"id": 3}]
+
+        # Generator variants accept any iterable on the left
+        self.assertEqual(list(idistinct(iter(left))), distinct(left))
+        self.assertEqual(list(iunion(iter(left), right)), union(left, right))
+        self.assertEqual(
+            list(iintersection(iter(left), right)), intersection(left, right)
+        )
+        self.assertEqual(list(idifference(iter(left), right)), difference(left, right))
+        self.assertEqual(list(iproduct(iter(left), right)), product(left, right))
+        for how in ("inner", "left", "right", "outer", "cross"):
+            self.assertEqual(
+                list(ijoin(left, right, [("id", "id")], how)),
+                join(left, right, [("id", "id")], how),
+            )
+
+        # Invalid join types are rejected before iteration starts
+        with self.assertRaises(ValueError):
+            ijoin(left, right, [("id", "id")], "sideways")
+
+    def test_set_operations_small_left(self):
+        left: Relation = [{"id": 2}, {"id": 9}, {"id": 2}]
+        right: Relation = [{"id": i} for i in range(5)]
+
+        self.assertEqual(intersection(left, right), [{"id": 2}, {"id": 2}])
+        self.assertEqual(difference(left, right), [{"id": 9}])
+        self.assertEqual(intersection([], right), [])
+        self.assertEqual(difference([], right), [])
+
     def test_intersection(self):
         r1: Relation = [
             {"id": 1, "name": "A"},
@@ -441,6 +569,53 @@ class TestCoreFunctions(unittest.TestCase):
         ]
         self.assertEqual(sorted_by_age_name, expected_age_name)
 
+    def test_sort_by_missing_values(self):
+        data: Relation = [
+            {"name": "Charlie", "age": 30},
+            {"name": "Alice"},
+            {"name": "Bob", "age": 20},
+            {"name": "Dave", "age": None},
+        ]
+
+        # Missing and null values sort first, even against numeric values
+        sorted_by_age = sort_by(data, ["age"])
+        self.assertEqual(
+            [r["name"] for r in sorted_by_age], ["Alice", "Dave", "Bob", "Charlie"]
+        )
+
+        sorted_by_age_desc = sort_by(data, ["age"], descending=True)
+        self.assertEqual(
+            [r["name"] for r in sorted_by_age_desc],
+            ["Charlie", "Bob", "Alice", "Dave"],
+        )
+
+    def test_sort_by_numeric_strings(self):
+        data: Relation = [
+            {"id": "10", "score": 2},
+            {"id": "9", "score": 3},
+            {"id": "100", "score": 1},
+        ]
+
+        # Numeric strings compare as numbers, arithmetic keys still work
+        self.assertEqual([r["id"] for r in sort_by(data, ["id"])], ["9", "10", "100"])
+        self.assertEqual(
+            [r["id"] for r in sort_by(data, ["score * -1"])], ["9", "10", "100"]
+        )
+
+    def test_sort_by_mixed_types(self):
+        data: Relation = [
+            {"v": "b"},
+            {"v": [1]},
+            {"v": 5},
+            {"v": None},
+            {"v": "a"},
+        ]
+
+        # Nulls, then numbers, then strings, then everything else
+        self.assertEqual(
+            [r["v"] for r in sort_by(data, ["v"])], [None, 5, "a", "b", [1]]
+        )
+
     def test_sort_by_empty(self):
         # Sort empty relation
         self.assertEqual(sort_by([], ["name"]), [])
@@ -475,6 +650,19 @@ class TestCoreFunctions(unittest.TestCase):
             prod_collide[0], {"id": 1, "name": "X", "b_id": 10, "b_name": "Y"}
         )
 
+        # Test product where row schemas vary across the relations
+        r_mixed1: Relation = [{"id": 1}, {"id": 2, "tag": "t"}]
+        r_mixed2: Relation = [{"tag": "u"}, {"other": 0}]
+        self.assertEqual(
+            product(r_mixed1, r_mixed2),
+            [
+                {"id": 1, "tag": "u"},
+                {"id": 1, "other": 0},
+                {"id": 2, "tag": "t", "b_tag": "u"},
+                {"id": 2, "tag": "t", "other": 0},
+            ],
+        )
+
     def test_groupby_agg_basic(self):
         data: Relation = [
             {"category": "A", "amount": 10, "value": 100},
@@ -82,3 +82,11 @@ class TestExport(unittest.TestCase):
         lines = list(dir_to_jsonl(str(self.test_dir)))
         self.assertEqual(len(lines), 1)
         self.assertEqual(json.loads(lines[0]), {"a": 1})
+
+    def test_dir_to_jsonl_preserves_order_across_batches(self):
+        for i in range(300):
+            (self.test_dir / f"item-{i}.json").write_text(json.dumps({"i": i}))
+        (self.test_dir / "item-150.json").write_text("not json")
+        lines = list(dir_to_jsonl(str(self.test_dir)))
+        expected = [{"i": i} for i in range(300) if i != 150]
+        self.assertEqual([json.loads(line) for line in lines], expected)
@@ -68,6 +68,45 @@ class TestExporter(unittest.TestCase):
         rows = list(reader)
         self.assertEqual(rows[0]["user"], json.dumps({"name": "Alice"}))
 
+    def test_explicit_fieldnames(self):
+        jsonl_stream = io.StringIO('{"id": 1, "user": {"name": "Alice"}, "x": 0}\n')
+        output_stream = io.StringIO()
+
+        jsonl_to_csv_stream(jsonl_stream, output_stream, fieldnames=["user.name", "id"])
+        self.assertEqual(output_stream.getvalue(), "user.name,id\nAlice,1\n")
+
+    def test_non_seekable_input(self):
+        class Pipe(io.StringIO):
+            def seekable(self):
+                return False
+
+        jsonl_data = '{"a": 1}\n{"b": 2}\n'
+        piped, seekable = io.StringIO(), io.StringIO()
+        jsonl_to_csv_stream(Pipe(jsonl_data), piped)
+        jsonl_to_csv_stream(io.StringIO(jsonl_data), seekable)
+        self.assertEqual(piped.getvalue(), "a,b\n1,\n,2\n")
+        self.assertEqual(seekable.getvalue(), piped.getvalue())
+
+    def test_column_functions_with_repeated_values(self):
+        calls = []
+
+        def label(value):
+            calls.append(value)
+            return f"<{value}>"
+
+        jsonl_stream = io.StringIO(
+            '{"c": "a"}\n{"c": "a"}\n{"c": 1}\n{"c": true}\n{"c": [1]}\n{"c": "a"}\n'
+        )
+        output_stream = io.StringIO()
+        jsonl_to_csv_stream(
+            jsonl_stream, output_stream, flatten=False, column_functions={"c": label}
+        )
+        self.assertEqual(
+            output_stream.getvalue(), "c\n<a>\n<a>\n<1>\n<True>\n<[1]>\n<a>\n"
+        )
+        # Both passes over the seekable input reuse one result per scalar
+        self.assertEqual(calls, ["a", 1, True, [1], [1]])
+
     def test_empty_input(self):
         jsonl_stream = io.StringIO("")
         output_stream = io.StringIO()
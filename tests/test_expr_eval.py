@@ -78,6 +78,21 @@ class TestExprEval:
         """Test getting values from simple, nested, and array fields."""
         assert parser.get_field_value(sample_data, path) == expected
 
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("name", "Alice"),
+            ("user.profile.type", "premium"),
+            ("orders[1].amount", 75.25),
+            ("orders.id", None),
+            ("orders[10].id", None),
+            ("name.first", None),
+        ],
+    )
+    def test_compile_path(self, parser, sample_data, path, expected):
+        """Test that compiled paths agree with get_field_value."""
+        assert parser.compile_path(path)(sample_data) == expected
+
     # Tests for set_field_value
     def test_set_field_value_simple(self, parser):
         """Test setting a value on a simple top-level field."""
@@ -133,6 +148,59 @@ class TestExprEval:
         """Test evaluation of various comparison and truthiness expressions."""
         assert parser.evaluate(expression, sample_data) is expected
 
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            ("age == 30", True),
+            ("name == Bob", False),
+            ("salary > bonus", True),
+            ("score == null", True),
+            ("missing_field", False),
+            ("", False),
+            # Compound conditions
+            ("age > 25 and name == Alice", True),
+            ("age > 25 and name == Bob", False),
+            ("name == Bob or user.id == 123", True),
+            ("name == Bob or age < 18", False),
+        ],
+    )
+    def test_compile(self, parser, sample_data, expression, expected):
+        """Test that compiled predicates agree with evaluate."""
+        assert parser.compile(expression)(sample_data) is expected
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "salary * 1.1",
+            "age + 5",
+            "user.profile.credits - 10",
+            "name",
+            "missing * 2",
+            "10 * 5",
+        ],
+    )
+    def test_compile_arithmetic(self, parser, sample_data, expression):
+        """Test that compiled arithmetic agrees with evaluate_arithmetic."""
+        compiled = parser.compile_arithmetic(expression)
+        expected = parser.evaluate_arithmetic(expression, sample_data)
+        assert compiled(sample_data) == expected
+
+    def test_compile_mixed_types(self, parser):
+        """Test that a predicate keeps working as row types change."""
+        predicate = parser.compile("age > 5")
+        rows = [{"age": "9"}, {"age": 7}, {"age": "1"}, {"age": 3}, {"age": "10"}]
+        assert [predicate(r) for r in rows] == [True, True, False, False, False]
+
+    def test_evaluate_reuses_compiled_expression(self, parser):
+        """Test that repeated evaluation sees each row's own values."""
+        rows = [{"age": 20, "bonus": 5}, {"age": 40}, {"age": None}]
+        assert [parser.evaluate("age > 30", r) for r in rows] == [False, True, False]
+        assert [parser.evaluate_arithmetic("age + bonus", r) for r in rows] == [
+            25.0,
+            None,
+            None,
+        ]
+
     # Tests for evaluate_arithmetic
     @pytest.mark.parametrize(
         "expression, expected",
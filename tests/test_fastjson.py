@@ -0,0 +1,26 @@
+import json
+import math
+import unittest
+
+from ja.fastjson import loads
+
+
+class TestFastJson(unittest.TestCase):
+
+    def test_matches_stdlib(self):
+        docs = ['{"a": 1, "b": [1.5, "x", null, true]}', "[]", '"\\u00e9"', " 3 \n"]
+        for doc in docs:
+            self.assertEqual(loads(doc), json.loads(doc))
+
+    def test_stdlib_extensions_still_parse(self):
+        self.assertTrue(math.isnan(loads('{"v": NaN}')["v"]))
+        big = 123456789012345678901234567890
+        self.assertEqual(loads(str(big)), big)
+
+    def test_invalid_input_raises_json_error(self):
+        with self.assertRaises(json.JSONDecodeError):
+            loads('{"a": ')
+
+
+if __name__ == "__main__":
+    unittest.main()
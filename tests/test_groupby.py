@@ -1,7 +1,10 @@
+import io
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
 from ja.core import Relation
-from ja.group import groupby_with_metadata, groupby_chained, groupby_agg
-from ja.agg import aggregate_grouped_data
+from ja.group import groupby_with_metadata, groupby_chained, groupby_agg, igroupby_agg
+from ja.agg import aggregate_by_key, aggregate_grouped_data
 
 
 class TestChainedGroupBy(unittest.TestCase):
@@ -161,6 +164,41 @@ class TestChainedGroupBy(unittest.TestCase):
         self.assertEqual(len(none_group), 2)
         self.assertEqual(sum(r["value"] for r in none_group), 60)
 
+    def test_unhashable_group_values(self):
+        """Test grouping on dict values at the first and the chained level."""
+        data: Relation = [
+            {"tag": {"k": 1}, "kind": [1]},
+            {"tag": {"k": 2}, "kind": [1]},
+            {"tag": {"k": 1}, "kind": [2]},
+        ]
+
+        grouped = groupby_with_metadata(data, "tag")
+        self.assertEqual([r["_group_size"] for r in grouped], [2, 2, 1])
+        self.assertEqual(grouped[0]["_groups"][0]["value"], {"k": 1})
+
+        chained = groupby_chained(grouped, "kind")
+        self.assertEqual([r["_groups"][1]["value"] for r in chained], [[1], [2], [1]])
+        self.assertEqual([r["_group_size"] for r in chained], [1, 1, 1])
+
+    def test_string_group_values_not_decoded(self):
+        """Test that string values that look like JSON stay strings."""
+        data: Relation = [{"code": "123"}, {"code": "true"}, {"code": "123"}]
+
+        grouped = groupby_with_metadata(data, "code")
+        values = [r["_groups"][0]["value"] for r in grouped]
+        self.assertEqual(values, ["123", "123", "true"])
+
+    def test_groupby_writes_no_output(self):
+        """Test that grouping does not print to stdout or stderr."""
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            by_region = groupby_with_metadata(self.sales_data, "region")
+            grouped = groupby_chained(by_region, "product")
+            groupby_agg(self.sales_data, "region", "count")
+            aggregate_grouped_data(grouped, "count")
+        self.assertEqual(out.getvalue(), "")
+        self.assertEqual(err.getvalue(), "")
+
     def test_metadata_preservation(self):
         """Test that original data is preserved through grouping."""
         grouped = groupby_with_metadata(self.sales_data, "region")
@@ -197,6 +235,157 @@ class TestChainedGroupBy(unittest.TestCase):
         south = next(r for r in result if r["region"] == "South")
         self.assertEqual(south["total"], 550)
 
+    def test_groupby_agg_same_field(self):
+        """Test several aggregations over one field in a single call."""
+        result = groupby_agg(
+            self.sales_data,
+            "region",
+            "total=sum(amount),avg=avg(amount),lo=min(amount),hi=max(amount),"
+            "amounts=list(amount)",
+        )
+
+        north = next(r for r in result if r["region"] == "North")
+        self.assertEqual(north["total"], 450)
+        self.assertEqual(north["avg"], 150)
+        self.assertEqual(north["lo"], 100)
+        self.assertEqual(north["hi"], 200)
+        self.assertEqual(north["amounts"], [100, 150, 200])
+
+    def test_groupby_agg_streamed_rows(self):
+        """Test that rows from a generator aggregate like the same list."""
+        spec = (
+            "n=count,total=sum(amount),first=first(date),amounts=list(amount),"
+            "widgets=count_if(product == Widget)"
+        )
+        expected = groupby_agg(self.sales_data, "region", spec)
+
+        with patch("ja.agg._CHUNK_ROWS", 2):
+            streamed = groupby_agg((row for row in self.sales_data), "region", spec)
+
+        self.assertEqual(streamed, expected)
+        self.assertEqual(groupby_agg(iter([]), "region", spec), [])
+
+    def test_repeated_list_aggregations_are_separate(self):
+        """Test that two list() results over one field are not the same list."""
+        spec = "a=list(amount),b=list(amount)"
+        grouped = groupby_with_metadata(self.sales_data, "region")
+
+        results = (
+            groupby_agg(self.sales_data, "region", spec)[0],
+            aggregate_grouped_data(grouped, spec)[0],
+        )
+        for result in results:
+            result["a"].append(0)
+            self.assertEqual(result["b"], [100, 150, 200])
+
+    def test_list_aggregation_value_types(self):
+        """Test that list() keeps ints and converts other numbers to floats."""
+        data = [
+            {"g": 1, "n": 1, "x": 1.5, "s": "2", "t": "a"},
+            {"g": 1, "n": 2, "x": 2.0, "s": "3.5", "t": "b"},
+        ]
+        spec = "n=list(n),x=list(x),s=list(s),t=list(t),e=list(n * 2)"
+        grouped = groupby_with_metadata(data, "g")
+
+        results = (
+            groupby_agg(data, "g", spec)[0],
+            aggregate_grouped_data(grouped, spec)[0],
+        )
+        for result in results:
+            self.assertEqual(result["n"], [1, 2])
+            self.assertEqual([type(v) for v in result["n"]], [int, int])
+            self.assertEqual([type(v) for v in result["x"]], [float, float])
+            self.assertEqual(result["s"], [2.0, 3.5])
+            self.assertEqual([type(v) for v in result["s"]], [float, float])
+            self.assertEqual(result["t"], ["a", "b"])
+            self.assertEqual(result["e"], [2.0, 4.0])
+            self.assertEqual([type(v) for v in result["e"]], [float, float])
+
+    def test_igroupby_agg_yields_groups(self):
+        """Test that the streaming variant yields the same rows as groupby_agg."""
+        spec = "total=sum(amount),first=first(date)"
+        results = igroupby_agg(iter(self.sales_data), "region", spec)
+
+        expected = groupby_agg(self.sales_data, "region", spec)
+        self.assertEqual(
+            next(results), {"region": "North", "total": 450, "first": "2024-01"}
+        )
+        self.assertEqual(list(results), expected[1:])
+
+    def test_groupby_agg_count_only(self):
+        """Test counting rows per group when no other aggregation is asked for."""
+        result = groupby_agg(iter(self.sales_data), "product", "n=count,rows=count")
+        self.assertEqual(
+            result,
+            [
+                {"product": "Widget", "n": 3, "rows": 3},
+                {"product": "Gadget", "n": 2, "rows": 2},
+            ],
+        )
+
+    def test_integer_sums_stay_exact(self):
+        """Test that sums over integer values are ints, even past 2**53."""
+        data: Relation = [
+            {"region": "North", "amount": 2**60},
+            {"region": "North", "amount": 1},
+            {"region": "North", "amount": None},
+            {"region": "South", "amount": 1.5},
+        ]
+        spec = "total=sum(amount)"
+
+        for result in (
+            groupby_agg(data, "region", spec),
+            aggregate_grouped_data(groupby_with_metadata(data, "region"), spec),
+        ):
+            north, south = result
+            self.assertEqual(north["total"], 2**60 + 1)
+            self.assertIs(type(north["total"]), int)
+            self.assertEqual(south["total"], 1.5)
+
+    def test_aggregate_by_key_conditional(self):
+        """Test conditional sums, averages and counts computed per group."""
+        result = list(aggregate_by_key(
+            self.sales_data,
+            lambda row: row["region"],
+            [
+                ("widget_total", "sum_if(amount, product == Widget)"),
+                ("widget_avg", "avg_if(amount, product == Widget)"),
+                ("gadgets", "count_if(product == Gadget)"),
+                ("none", "avg_if(amount, amount > 1000)"),
+            ],
+        ))
+
+        north = {"widget_total": 300, "widget_avg": 150, "gadgets": 1, "none": 0}
+        south = {"widget_total": 250, "widget_avg": 250, "gadgets": 1, "none": 0}
+        self.assertEqual(result, [("North", north), ("South", south)])
+
+    def test_groupby_agg_non_numeric_values(self):
+        """Test that a non-numeric value fails only its own group's aggregation."""
+        data: Relation = [
+            {"region": "North", "amount": 5},
+            {"region": "South", "amount": "n/a"},
+            {"region": "North", "amount": None},
+        ]
+
+        result = groupby_agg(data[::2], "region", "lo=min(amount),hi=max(amount)")
+        self.assertEqual(result, [{"region": "North", "lo": 5, "hi": 5}])
+
+        with self.assertRaisesRegex(ValueError, "'n/a'"):
+            groupby_agg(data, "region", "lo=min(amount)")
+
+    def test_groupby_agg_first_last_and_conditional(self):
+        """Test row-based and conditional aggregations alongside each other."""
+        result = groupby_agg(
+            self.sales_data,
+            "region",
+            "n=count,first=first(date),last=last(date),"
+            "widgets=count_if(product == Widget)",
+        )
+
+        north = {"region": "North", "n": 3, "first": "2024-01", "last": "2024-02"}
+        south = {"region": "South", "n": 2, "first": "2024-01", "last": "2024-02"}
+        self.assertEqual(result, [{**north, "widgets": 2}, {**south, "widgets": 1}])
+
 
 if __name__ == "__main__":
     unittest.main()